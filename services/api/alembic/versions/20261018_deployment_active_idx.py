@@ -0,0 +1,34 @@
+"""Add a partial index on each camera's active deployment.
+
+Ingestion looks up the active deployment (end_date IS NULL) for the
+camera on every image with GPS. The partial index holds one entry per
+camera with an open deployment, so that lookup is a single small B-tree
+descent instead of a walk over the camera's deployment history.
+
+Revision ID: 20261018_deployment_active_idx
+Revises: 20261018_drop_fk_prefix_idx
+Create Date: 2026-10-18
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = '20261018_deployment_active_idx'
+down_revision = '20261018_drop_fk_prefix_idx'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_index(
+        'ix_deployments_camera_id_active',
+        'deployments',
+        ['camera_id'],
+        postgresql_where=sa.text('end_date IS NULL'),
+        if_not_exists=True,
+    )
+
+
+def downgrade():
+    op.drop_index('ix_deployments_camera_id_active', table_name='deployments', if_exists=True)
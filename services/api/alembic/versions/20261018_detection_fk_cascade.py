@@ -0,0 +1,59 @@
+"""Cascade image deletes to detections and classifications in the database.
+
+detections.image_id and classifications.detection_id had plain foreign
+keys, so deleting images meant loading every detection and deleting its
+classifications one statement at a time. With ON DELETE CASCADE the
+database removes the children in the same statement.
+
+Revision ID: 20261018_detection_fk_cascade
+Revises: 20261018_pnp_channels_jsonb
+Create Date: 2026-10-18
+
+"""
+from alembic import op
+
+
+revision = '20261018_detection_fk_cascade'
+down_revision = '20261018_pnp_channels_jsonb'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.drop_constraint('detections_image_id_fkey', 'detections', type_='foreignkey')
+    op.create_foreign_key(
+        'detections_image_id_fkey',
+        'detections',
+        'images',
+        ['image_id'],
+        ['id'],
+        ondelete='CASCADE',
+    )
+    op.drop_constraint('classifications_detection_id_fkey', 'classifications', type_='foreignkey')
+    op.create_foreign_key(
+        'classifications_detection_id_fkey',
+        'classifications',
+        'detections',
+        ['detection_id'],
+        ['id'],
+        ondelete='CASCADE',
+    )
+
+
+def downgrade():
+    op.drop_constraint('classifications_detection_id_fkey', 'classifications', type_='foreignkey')
+    op.create_foreign_key(
+        'classifications_detection_id_fkey',
+        'classifications',
+        'detections',
+        ['detection_id'],
+        ['id'],
+    )
+    op.drop_constraint('detections_image_id_fkey', 'detections', type_='foreignkey')
+    op.create_foreign_key(
+        'detections_image_id_fkey',
+        'detections',
+        'images',
+        ['image_id'],
+        ['id'],
+    )
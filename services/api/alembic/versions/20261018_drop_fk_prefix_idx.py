@@ -0,0 +1,32 @@
+"""Drop single-column foreign key indexes covered by composite indexes.
+
+ix_images_camera_id, ix_detections_image_id and
+ix_classifications_detection_id are each the leading column of a
+composite index added in 20261018_report_join_idx, so the planner can use
+the composite for the same lookups. Dropping them saves a B-tree write on
+every ingested image, detection and classification.
+
+Revision ID: 20261018_drop_fk_prefix_idx
+Revises: 20261018_pnp_species_gin
+Create Date: 2026-10-18
+
+"""
+from alembic import op
+
+
+revision = '20261018_drop_fk_prefix_idx'
+down_revision = '20261018_pnp_species_gin'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.drop_index('ix_images_camera_id', table_name='images', if_exists=True)
+    op.drop_index('ix_detections_image_id', table_name='detections', if_exists=True)
+    op.drop_index('ix_classifications_detection_id', table_name='classifications', if_exists=True)
+
+
+def downgrade():
+    op.create_index('ix_classifications_detection_id', 'classifications', ['detection_id'], if_not_exists=True)
+    op.create_index('ix_detections_image_id', 'detections', ['image_id'], if_not_exists=True)
+    op.create_index('ix_images_camera_id', 'images', ['camera_id'], if_not_exists=True)
@@ -0,0 +1,36 @@
+"""Replace the notification_logs created_at B-tree with a BRIN index.
+
+notification_logs is an append-only audit table: rows arrive in
+created_at order and no query looks one up by time. A BRIN index keeps
+range scans for audits and cleanup possible at a tiny fraction of the
+B-tree's size and insert cost.
+
+Revision ID: 20261018_notification_logs_brin
+Revises: 20261018_deployment_active_idx
+Create Date: 2026-10-18
+
+"""
+from alembic import op
+
+
+revision = '20261018_notification_logs_brin'
+down_revision = '20261018_deployment_active_idx'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_index(
+        'ix_notification_logs_created_at_brin',
+        'notification_logs',
+        ['created_at'],
+        postgresql_using='brin',
+        postgresql_with={'pages_per_range': 32},
+        if_not_exists=True,
+    )
+    op.drop_index('ix_notification_logs_created_at', table_name='notification_logs', if_exists=True)
+
+
+def downgrade():
+    op.create_index('ix_notification_logs_created_at', 'notification_logs', ['created_at'], if_not_exists=True)
+    op.drop_index('ix_notification_logs_created_at_brin', table_name='notification_logs', if_exists=True)
@@ -0,0 +1,32 @@
+"""Add a GIN index on project_notification_preferences.notification_channels.
+
+The rule engine checks that an event type is enabled with Telegram as a
+channel using jsonb containment (@>) on the notification_channels column.
+The column is json, so the index is on the same jsonb cast expression the
+query uses. jsonb_path_ops only supports @> and makes a smaller index than
+the default operator class.
+
+Revision ID: 20261018_pnp_channels_gin
+Revises: 20261018_report_join_idx
+Create Date: 2026-10-18
+
+"""
+from alembic import op
+
+
+revision = '20261018_pnp_channels_gin'
+down_revision = '20261018_report_join_idx'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.execute(
+        "CREATE INDEX IF NOT EXISTS ix_pnp_notification_channels_gin "
+        "ON project_notification_preferences "
+        "USING gin ((notification_channels::jsonb) jsonb_path_ops)"
+    )
+
+
+def downgrade():
+    op.execute("DROP INDEX IF EXISTS ix_pnp_notification_channels_gin")
@@ -0,0 +1,57 @@
+"""Store project_notification_preferences.notification_channels as jsonb.
+
+The rule engine and the email report match preferences with jsonb
+containment and ?| on this column. As json it had to be cast on every
+row, and the GIN indexes were built on that cast. Storing jsonb keeps
+the parsed form and lets the indexes sit on the column itself.
+
+Revision ID: 20261018_pnp_channels_jsonb
+Revises: 20261018_notification_logs_brin
+Create Date: 2026-10-18
+
+"""
+from alembic import op
+
+
+revision = '20261018_pnp_channels_jsonb'
+down_revision = '20261018_notification_logs_brin'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.execute("DROP INDEX IF EXISTS ix_pnp_notification_channels_gin")
+    op.execute("DROP INDEX IF EXISTS ix_pnp_notify_species_gin")
+    op.execute(
+        "ALTER TABLE project_notification_preferences "
+        "ALTER COLUMN notification_channels TYPE jsonb USING notification_channels::jsonb"
+    )
+    op.execute(
+        "CREATE INDEX ix_pnp_notification_channels_gin "
+        "ON project_notification_preferences "
+        "USING gin (notification_channels jsonb_path_ops)"
+    )
+    op.execute(
+        "CREATE INDEX ix_pnp_notify_species_gin "
+        "ON project_notification_preferences "
+        "USING gin (((notification_channels -> 'species_detection') -> 'notify_species'))"
+    )
+
+
+def downgrade():
+    op.execute("DROP INDEX IF EXISTS ix_pnp_notify_species_gin")
+    op.execute("DROP INDEX IF EXISTS ix_pnp_notification_channels_gin")
+    op.execute(
+        "ALTER TABLE project_notification_preferences "
+        "ALTER COLUMN notification_channels TYPE json USING notification_channels::json"
+    )
+    op.execute(
+        "CREATE INDEX ix_pnp_notification_channels_gin "
+        "ON project_notification_preferences "
+        "USING gin ((notification_channels::jsonb) jsonb_path_ops)"
+    )
+    op.execute(
+        "CREATE INDEX ix_pnp_notify_species_gin "
+        "ON project_notification_preferences "
+        "USING gin (((notification_channels::jsonb -> 'species_detection') -> 'notify_species'))"
+    )
@@ -0,0 +1,32 @@
+"""Add a GIN index on the species_detection notify_species list.
+
+Batches of species detections match preferences with the jsonb ?|
+(any of) operator on notification_channels -> 'species_detection' ->
+'notify_species'. The jsonb_path_ops index on the whole column only
+serves @>, so this expression index uses the default jsonb_ops class,
+which supports ?|.
+
+Revision ID: 20261018_pnp_species_gin
+Revises: 20261018_pnp_telegram_idx
+Create Date: 2026-10-18
+
+"""
+from alembic import op
+
+
+revision = '20261018_pnp_species_gin'
+down_revision = '20261018_pnp_telegram_idx'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.execute(
+        "CREATE INDEX IF NOT EXISTS ix_pnp_notify_species_gin "
+        "ON project_notification_preferences "
+        "USING gin (((notification_channels::jsonb -> 'species_detection') -> 'notify_species'))"
+    )
+
+
+def downgrade():
+    op.execute("DROP INDEX IF EXISTS ix_pnp_notify_species_gin")
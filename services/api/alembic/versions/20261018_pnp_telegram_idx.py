@@ -0,0 +1,48 @@
+"""Add partial indexes for the notification rule engine lookup.
+
+The rule engine reads the preferences of one project for users with a
+Telegram chat id and a notification_channels config, and keeps only
+active, verified users. Both partial indexes cover just the rows that
+can ever match: the preferences index carries user_id and
+telegram_chat_id, and the users index answers the active/verified
+semi-join without touching the heap.
+
+Revision ID: 20261018_pnp_telegram_idx
+Revises: 20261018_pnp_channels_gin
+Create Date: 2026-10-18
+
+"""
+from alembic import op
+
+
+revision = '20261018_pnp_telegram_idx'
+down_revision = '20261018_pnp_channels_gin'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_index(
+        'ix_pnp_project_id_telegram',
+        'project_notification_preferences',
+        ['project_id'],
+        postgresql_include=['user_id', 'telegram_chat_id'],
+        postgresql_where='telegram_chat_id IS NOT NULL AND notification_channels IS NOT NULL',
+        if_not_exists=True,
+    )
+    op.create_index(
+        'ix_users_id_active_verified',
+        'users',
+        ['id'],
+        postgresql_where='is_active AND is_verified',
+        if_not_exists=True,
+    )
+
+
+def downgrade():
+    op.drop_index('ix_users_id_active_verified', table_name='users', if_exists=True)
+    op.drop_index(
+        'ix_pnp_project_id_telegram',
+        table_name='project_notification_preferences',
+        if_exists=True,
+    )
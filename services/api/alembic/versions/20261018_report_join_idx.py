@@ -0,0 +1,65 @@
+"""Add covering indexes for the camera -> image -> detection -> classification join.
+
+The email report and statistics queries filter cameras by project, then
+walk images by (camera_id, captured_at), detections by (image_id,
+confidence) and classifications by detection_id. The single-column
+indexes on the foreign keys still force a heap fetch per row to read the
+filter and output columns. These composite indexes carry those columns,
+so each step of the join can be an index-only scan.
+
+No partial index on a fixed confidence: the detection threshold is a
+per-project setting.
+
+Revision ID: 20261018_report_join_idx
+Revises: 20260807_camera_alert_rules
+Create Date: 2026-10-18
+
+"""
+from alembic import op
+
+
+revision = '20261018_report_join_idx'
+down_revision = '20260807_camera_alert_rules'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_index(
+        'ix_images_camera_id_captured_at_cover',
+        'images',
+        ['camera_id', 'captured_at'],
+        postgresql_include=['id', 'is_verified'],
+        if_not_exists=True,
+    )
+    op.create_index(
+        'ix_detections_image_id_confidence_cover',
+        'detections',
+        ['image_id', 'confidence'],
+        postgresql_include=['id', 'category'],
+        if_not_exists=True,
+    )
+    op.create_index(
+        'ix_classifications_detection_species_conf',
+        'classifications',
+        ['detection_id', 'species', 'confidence'],
+        if_not_exists=True,
+    )
+
+
+def downgrade():
+    op.drop_index(
+        'ix_classifications_detection_species_conf',
+        table_name='classifications',
+        if_exists=True,
+    )
+    op.drop_index(
+        'ix_detections_image_id_confidence_cover',
+        table_name='detections',
+        if_exists=True,
+    )
+    op.drop_index(
+        'ix_images_camera_id_captured_at_cover',
+        table_name='images',
+        if_exists=True,
+    )
@@ -295,15 +295,10 @@ def _delete_staging(staged_object_key: str) -> None:
     storage = StorageClient()
     try:
         if staged_object_key.endswith("/"):
-            for key in storage.list_objects(BUCKET_BULK_UPLOAD_STAGING, staged_object_key):
-                try:
-                    storage.delete_object(BUCKET_BULK_UPLOAD_STAGING, key)
-                except Exception as exc:
-                    logger.warning(
-                        "Failed to delete staged file",
-                        key=key,
-                        error=str(exc),
-                    )
+            storage.delete_objects(
+                BUCKET_BULK_UPLOAD_STAGING,
+                storage.list_objects(BUCKET_BULK_UPLOAD_STAGING, staged_object_key),
+            )
         else:
             storage.delete_object(BUCKET_BULK_UPLOAD_STAGING, staged_object_key)
     except Exception as exc:
@@ -768,7 +763,7 @@ async def _upload_bulk_file_inner(
     object_key = f"{_staging_prefix(project_id, job_uuid)}{index:06d}_{safe_name}"
 
     storage = StorageClient()
-    storage.upload_fileobj(io.BytesIO(body), BUCKET_BULK_UPLOAD_STAGING, object_key)
+    storage.put_bytes(body, BUCKET_BULK_UPLOAD_STAGING, object_key)
 
     return {"object_key": object_key, "size": len(body)}
 
@@ -875,20 +875,16 @@ async def _delete_camera_cascade(db: AsyncSession, camera: Camera) -> dict:
     counts = {"images": 0, "detections": 0, "classifications": 0, "minio_files": 0}
     camera_device_id = camera.device_id or str(camera.id)
 
-    images = (
-        await db.execute(select(Image).where(Image.camera_id == camera.id))
-    ).scalars().all()
-    for image in images:
-        detections = (
-            await db.execute(select(Detection).where(Detection.image_id == image.id))
-        ).scalars().all()
-        for detection in detections:
-            res = await db.execute(
-                sql_delete(Classification).where(Classification.detection_id == detection.id)
-            )
-            counts["classifications"] += res.rowcount
-        res = await db.execute(sql_delete(Detection).where(Detection.image_id == image.id))
-        counts["detections"] += res.rowcount
+    # The foreign keys cascade, but delete each level explicitly so the
+    # counts can be reported. One statement per level, not per row.
+    image_ids = select(Image.id).where(Image.camera_id == camera.id)
+    detection_ids = select(Detection.id).where(Detection.image_id.in_(image_ids))
+    res = await db.execute(
+        sql_delete(Classification).where(Classification.detection_id.in_(detection_ids))
+    )
+    counts["classifications"] += res.rowcount
+    res = await db.execute(sql_delete(Detection).where(Detection.image_id.in_(image_ids)))
+    counts["detections"] += res.rowcount
 
     res = await db.execute(sql_delete(Image).where(Image.camera_id == camera.id))
     counts["images"] += res.rowcount
@@ -896,9 +892,9 @@ async def _delete_camera_cascade(db: AsyncSession, camera: Camera) -> dict:
     try:
         storage = StorageClient()
         for bucket in [BUCKET_RAW_IMAGES, BUCKET_CROPS, BUCKET_THUMBNAILS]:
-            for obj_name in storage.list_objects(bucket, prefix=f"{camera_device_id}/"):
-                storage.delete_object(bucket, obj_name)
-                counts["minio_files"] += 1
+            counts["minio_files"] += storage.delete_objects(
+                bucket, storage.list_objects(bucket, prefix=f"{camera_device_id}/")
+            )
     except Exception as e:
         logger.error(
             "Failed to delete some MinIO files",
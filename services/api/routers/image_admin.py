@@ -701,29 +701,14 @@ async def delete_images_by_ids(
     success_count = 0
     for image in images:
         try:
-            # Delete classifications via detections
-            detections = (
-                await db.execute(
-                    select(Detection).where(Detection.image_id == image.id)
-                )
-            ).scalars().all()
-
-            for detection in detections:
-                await db.execute(
-                    sql_delete(Classification).where(Classification.detection_id == detection.id)
-                )
-
-            # Delete detections
-            await db.execute(
-                sql_delete(Detection).where(Detection.image_id == image.id)
-            )
-
             # Delete human observations
             await db.execute(
                 sql_delete(HumanObservation).where(HumanObservation.image_id == image.id)
             )
 
-            # Delete image record
+            # Delete image record. Its detections and classifications go with
+            # it through ON DELETE CASCADE; the relationships are passive_deletes,
+            # so the ORM does not load them first.
             await db.delete(image)
 
             # Delete MinIO files
@@ -735,8 +720,7 @@ async def delete_images_by_ids(
                     storage.delete_object(BUCKET_THUMBNAILS, image.thumbnail_path)
                 # Delete crops (named {image_uuid}_{idx}.jpg)
                 crop_objects = storage.list_objects(BUCKET_CROPS, prefix=f"{image.uuid}_")
-                for obj_name in crop_objects:
-                    storage.delete_object(BUCKET_CROPS, obj_name)
+                storage.delete_objects(BUCKET_CROPS, crop_objects)
             except Exception as e:
                 logger.error(
                     "Failed to delete some MinIO files for image",
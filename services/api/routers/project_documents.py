@@ -87,7 +87,7 @@ async def upload_document(
 
     # Upload to MinIO
     storage = StorageClient()
-    storage.upload_fileobj(io.BytesIO(content), BUCKET_PROJECT_DOCUMENTS, storage_path)
+    storage.put_bytes(content, BUCKET_PROJECT_DOCUMENTS, storage_path)
 
     # Create database record
     doc = ProjectDocument(
@@ -459,29 +459,22 @@ async def delete_project(
     for camera in cameras:
         camera_device_id = camera.device_id or str(camera.id)
 
-        # Get all images for this camera
-        images_query = select(Image).where(Image.camera_id == camera.id)
-        images_result = await db.execute(images_query)
-        images = images_result.scalars().all()
-
-        for image in images:
-            # Get all detections for this image
-            detections_query = select(Detection).where(Detection.image_id == image.id)
-            detections_result = await db.execute(detections_query)
-            detections = detections_result.scalars().all()
-
-            for detection in detections:
-                # Delete all classifications for this detection
-                classifications_result = await db.execute(
-                    sql_delete(Classification).where(Classification.detection_id == detection.id)
-                )
-                deleted_classifications += classifications_result.rowcount
+        # The foreign keys cascade, but delete each level explicitly so the
+        # counts can be reported. One statement per level, not per row.
+        image_ids = select(Image.id).where(Image.camera_id == camera.id)
+        detection_ids = select(Detection.id).where(Detection.image_id.in_(image_ids))
+
+        # Delete all classifications for this camera's images
+        classifications_result = await db.execute(
+            sql_delete(Classification).where(Classification.detection_id.in_(detection_ids))
+        )
+        deleted_classifications += classifications_result.rowcount
 
-            # Delete all detections for this image
-            detections_result = await db.execute(
-                sql_delete(Detection).where(Detection.image_id == image.id)
-            )
-            deleted_detections += detections_result.rowcount
+        # Delete all detections for this camera's images
+        detections_result = await db.execute(
+            sql_delete(Detection).where(Detection.image_id.in_(image_ids))
+        )
+        deleted_detections += detections_result.rowcount
 
         # Delete all images for this camera
         images_result = await db.execute(
@@ -493,21 +486,15 @@ async def delete_project(
         try:
             # List and delete objects in raw-images bucket
             raw_objects = storage.list_objects(BUCKET_RAW_IMAGES, prefix=f"{camera_device_id}/")
-            for obj_name in raw_objects:
-                storage.delete_object(BUCKET_RAW_IMAGES, obj_name)
-                deleted_minio_files += 1
+            deleted_minio_files += storage.delete_objects(BUCKET_RAW_IMAGES, raw_objects)
 
             # List and delete objects in crops bucket
             crop_objects = storage.list_objects(BUCKET_CROPS, prefix=f"{camera_device_id}/")
-            for obj_name in crop_objects:
-                storage.delete_object(BUCKET_CROPS, obj_name)
-                deleted_minio_files += 1
+            deleted_minio_files += storage.delete_objects(BUCKET_CROPS, crop_objects)
 
             # List and delete objects in thumbnails bucket
             thumb_objects = storage.list_objects(BUCKET_THUMBNAILS, prefix=f"{camera_device_id}/")
-            for obj_name in thumb_objects:
-                storage.delete_object(BUCKET_THUMBNAILS, obj_name)
-                deleted_minio_files += 1
+            deleted_minio_files += storage.delete_objects(BUCKET_THUMBNAILS, thumb_objects)
 
             logger.debug(
                 "Deleted MinIO files for camera",
@@ -535,9 +522,7 @@ async def delete_project(
     # Step 4b: Delete project documents from MinIO
     try:
         doc_objects = storage.list_objects(BUCKET_PROJECT_DOCUMENTS, prefix=f"{project_id}/")
-        for obj_name in doc_objects:
-            storage.delete_object(BUCKET_PROJECT_DOCUMENTS, obj_name)
-            deleted_minio_files += 1
+        deleted_minio_files += storage.delete_objects(BUCKET_PROJECT_DOCUMENTS, doc_objects)
     except Exception as e:
         logger.error("Failed to delete project documents from MinIO", project_id=project_id, error=str(e))
 
@@ -357,9 +357,9 @@ def _download_staged_zip(storage: StorageClient, staged_object_key: str) -> str:
     """Stream the staged ZIP to a tmp file. Caller deletes the path."""
     tmp_handle, tmp_path = tempfile.mkstemp(suffix=".zip")
     os.close(tmp_handle)
-    zip_bytes = storage.download_fileobj(BUCKET_BULK_UPLOAD_STAGING, staged_object_key)
-    with open(tmp_path, "wb") as fh:
-        fh.write(zip_bytes)
+    # download_file writes to disk in chunks, so the ZIP is never held
+    # in memory whole.
+    storage.download_file(BUCKET_BULK_UPLOAD_STAGING, staged_object_key, tmp_path)
     return tmp_path
 
 
@@ -611,23 +611,6 @@ def _inspect_job(job_uuid: str) -> None:
                 pass
 
 
-def _list_prefix(storage: StorageClient, prefix: str) -> list:
-    """
-    List every object under the job's staging prefix.
-
-    Uses paginator-style calls so a 5000-file job is returned in full.
-    The wrapper in shared/storage.py caps at a single page, which is
-    fine for &lt; 1000 objects but truncates the rest. Drop to the boto3
-    paginator for safety.
-    """
-    keys: list = []
-    paginator = storage.client.get_paginator("list_objects_v2")
-    for page in paginator.paginate(Bucket=BUCKET_BULK_UPLOAD_STAGING, Prefix=prefix):
-        for obj in page.get("Contents", []) or []:
-            keys.append(obj["Key"])
-    return keys
-
-
 def _process_prefix_job(
     job_uuid: str,
     job_id: int,
@@ -650,7 +633,7 @@ def _process_prefix_job(
     other_skipped = 0
     file_log: list = []
 
-    object_keys = sorted(_list_prefix(storage, staged_prefix))
+    object_keys = sorted(storage.list_objects(BUCKET_BULK_UPLOAD_STAGING, staged_prefix))
     actual_count = len(object_keys)
     logger.info(
         "Processing bulk upload prefix",
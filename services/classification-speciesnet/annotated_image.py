@@ -327,11 +327,11 @@ def upload_annotated_image_to_minio(
         object_path = f"annotated/{image_uuid}.jpg"
 
         storage = StorageClient()
-        buffer = BytesIO(image_bytes)
-        storage.upload_fileobj(
-            file_obj=buffer,
+        storage.put_bytes(
+            data=image_bytes,
             bucket='thumbnails',
-            object_name=object_path
+            object_name=object_path,
+            content_type='image/jpeg'
         )
 
         logger.debug(
@@ -162,7 +162,7 @@ def insert_classifications(classifications: List[Classification]) -> List[int]:
 
     try:
         with get_db_session() as db:
-            classification_ids = []
+            records = []
 
             for classification in classifications:
                 classification_record = ClassificationModel(
@@ -177,10 +177,12 @@ def insert_classifications(classifications: List[Classification]) -> List[int]:
                 if hasattr(classification, 'raw_confidence') and classification.raw_confidence is not None:
                     classification_record.raw_confidence = classification.raw_confidence
 
-                db.add(classification_record)
-                db.flush()  # Get ID without committing
+                records.append(classification_record)
 
-                classification_ids.append(classification_record.id)
+            # One flush sends all rows as a single multi-row INSERT ... RETURNING
+            db.add_all(records)
+            db.flush()
+            classification_ids = [record.id for record in records]
 
             db.commit()
 
@@ -81,7 +81,7 @@ def insert_detections(
                 raise ValueError(f"Image not found: {image_uuid}")
 
             # Insert detections
-            detection_ids = []
+            records = []
             for detection in detections:
                 # Create bbox dict for JSON storage
                 bbox = {
@@ -99,10 +99,12 @@ def insert_detections(
                     confidence=detection.confidence
                 )
 
-                db.add(detection_record)
-                db.flush()  # Get ID without committing
+                records.append(detection_record)
 
-                detection_ids.append(detection_record.id)
+            # One flush sends all rows as a single multi-row INSERT ... RETURNING
+            db.add_all(records)
+            db.flush()
+            detection_ids = [record.id for record in records]
 
             db.commit()
 
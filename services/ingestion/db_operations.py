@@ -2,6 +2,7 @@
 Database operations for ingestion service
 """
 import os
+import time
 import uuid
 from datetime import date, datetime, timedelta, timezone
 from typing import Optional, Tuple
@@ -23,6 +24,11 @@ from utils import is_valid_gps
 
 logger = get_logger("ingestion")
 
+# The server timezone is read for every image with an EXIF offset tag but
+# changes only when an admin edits it, so it is kept for a short time.
+SERVER_TIMEZONE_TTL_SECONDS = 60
+_server_timezone: Tuple[float, Optional[ZoneInfo]] = (0.0, None)
+
 # A camera that moves more than SITE_THRESHOLD_METERS leaves its current site, so
 # a new deployment starts. One threshold, defined in shared.geo. Deriving the
 # deployment fully from a Site row is Phase 2 of the site work; for now this
@@ -36,13 +42,20 @@ def get_server_timezone() -> ZoneInfo:
     The ingestion pipeline stores camera wall-clock times as naive datetimes,
     so this value is not needed for writes. It is used only for side
     validations (e.g. warning when an EXIF OffsetTimeOriginal tag disagrees
-    with the declared server timezone). Falls back to UTC if unset.
+    with the declared server timezone). Falls back to UTC if unset. Cached for
+    SERVER_TIMEZONE_TTL_SECONDS, so an admin change shows up within a minute.
     """
+    global _server_timezone
+    now = time.monotonic()
+    expires_at, server_tz = _server_timezone
+    if server_tz is not None and expires_at > now:
+        return server_tz
+
     with get_db_session() as session:
-        result = session.execute(select(ServerSettings).limit(1))
-        settings = result.scalar_one_or_none()
-        name = settings.timezone if settings and settings.timezone else "UTC"
-        return ZoneInfo(name)
+        name = session.execute(select(ServerSettings.timezone).limit(1)).scalar_one_or_none()
+    server_tz = ZoneInfo(name or "UTC")
+    _server_timezone = (now + SERVER_TIMEZONE_TTL_SECONDS, server_tz)
+    return server_tz
 
 
 def get_camera_by_device_id(device_id: str) -> Optional[int]:
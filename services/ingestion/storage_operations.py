@@ -104,14 +104,14 @@ def generate_and_upload_thumbnail(filepath: str, camera_id: str, image_uuid: str
             # Save to BytesIO buffer
             buffer = BytesIO()
             thumbnail.save(buffer, format='JPEG', quality=85, optimize=True)
-            buffer.seek(0)
 
             # Upload to MinIO
             storage = StorageClient()
-            storage.upload_fileobj(
-                file_obj=buffer,
+            storage.put_bytes(
+                data=buffer.getvalue(),
                 bucket=BUCKET_THUMBNAILS,
-                object_name=object_path
+                object_name=object_path,
+                content_type='image/jpeg'
             )
 
             logger.info(
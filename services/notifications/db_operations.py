@@ -59,7 +59,6 @@ def create_notification_log(
 
         session.add(log)
         session.commit()
-        session.refresh(log)
 
         logger.debug(
             "Created notification log",
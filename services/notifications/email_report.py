@@ -23,10 +23,9 @@ from shared.email_renderer import render_email
 from db_operations import create_notification_log, get_server_timezone
 from report_stats import (
     get_overview_stats,
-    get_species_distribution,
+    get_species_and_activity,
     get_camera_health_summary,
     get_notable_detections,
-    get_activity_summary,
     get_images_timeline
 )
 
@@ -138,7 +137,13 @@ def _send_reports_for_frequency(
             .join(Project, ProjectNotificationPreference.project_id == Project.id)
             .where(
                 User.is_active == True,
-                User.is_verified == True
+                User.is_verified == True,
+                ProjectNotificationPreference.notification_channels.isnot(None),
+                # Enabled at this frequency, served by the GIN index on
+                # notification_channels
+                ProjectNotificationPreference.notification_channels.contains(
+                    {'email_report': {'enabled': True, 'frequency': frequency}}
+                )
             )
         )
 
@@ -173,6 +178,11 @@ def _send_reports_for_frequency(
         email_queue = RedisQueue(QUEUE_NOTIFICATION_EMAIL)
         messages_queued = 0
 
+        # Report content depends only on the project and the period, so every
+        # member of a project gets the same report. Build it once per project
+        # instead of re-running all stats queries for each recipient.
+        reports_by_project: Dict[int, Tuple[str, str]] = {}
+
         for pref, user, project, email_config in eligible_prefs:
             try:
                 to_email = user.email
@@ -186,16 +196,19 @@ def _send_reports_for_frequency(
                     continue
 
                 # Generate report content
-                html_content, text_content = generate_report_content(
-                    db=db,
-                    project_id=project.id,
-                    project_name=project.name,
-                    start_date=start_date,
-                    end_date=end_date,
-                    period_label=period_label,
-                    frequency=frequency,
-                    email_config=email_config
-                )
+                if project.id not in reports_by_project:
+                    reports_by_project[project.id] = generate_report_content(
+                        db=db,
+                        project_id=project.id,
+                        project_name=project.name,
+                        detection_threshold=project.detection_threshold,
+                        start_date=start_date,
+                        end_date=end_date,
+                        period_label=period_label,
+                        frequency=frequency,
+                        email_config=email_config
+                    )
+                html_content, text_content = reports_by_project[project.id]
 
                 # Build subject line
                 frequency_label = frequency.capitalize()
@@ -294,6 +307,7 @@ def generate_report_content(
     db,
     project_id: int,
     project_name: str,
+    detection_threshold: float,
     start_date: date,
     end_date: date,
     period_label: str,
@@ -307,6 +321,7 @@ def generate_report_content(
         db: Database session
         project_id: Project ID
         project_name: Project name
+        detection_threshold: Project detection threshold, shared by all stats queries
         start_date: Report period start
         end_date: Report period end
         period_label: Human-readable period
@@ -324,10 +339,16 @@ def generate_report_content(
     frequency_label = "Capture" if frequency == 'daily' else "Highlight"
 
     # Get overview stats
-    overview = get_overview_stats(db, project_id, start_date, end_date)
+    overview = get_overview_stats(
+        db, project_id, start_date, end_date, detection_threshold=detection_threshold
+    )
 
-    # Get activity summary for detection count
-    activity = get_activity_summary(db, project_id, start_date, end_date)
+    # Get top species (limit to 5 for simplified view) and the activity
+    # summary for the detection count, both from one scan
+    species, activity = get_species_and_activity(
+        db, project_id, start_date, end_date, limit=5,
+        detection_threshold=detection_threshold
+    )
 
     # Build stats object for template
     stats = {
@@ -336,9 +357,6 @@ def generate_report_content(
         'species_count': overview['total_species']
     }
 
-    # Get top species (limit to 5 for simplified view)
-    species = get_species_distribution(db, project_id, start_date, end_date, limit=5)
-
     # Get camera health (always included)
     cameras = get_camera_health_summary(db, project_id)
 
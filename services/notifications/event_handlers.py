@@ -13,7 +13,7 @@ from shared.logger import get_logger
 from shared.queue import RedisQueue, QUEUE_NOTIFICATION_TELEGRAM
 from shared.config import get_settings
 
-from db_operations import create_notification_log, get_project_name, get_image_site_label, get_camera_site_label
+from db_operations import create_notification_log, get_project_name, get_image_site_label
 
 logger = get_logger("notifications.handlers")
 settings = get_settings()
@@ -120,134 +120,31 @@ def handle_species_detection(
         user_count=len(matching_users)
     )
 
-    # Initialize Telegram queue
-    telegram_queue = RedisQueue(QUEUE_NOTIFICATION_TELEGRAM)
-
-    for user in matching_users:
-        channels = user.get('channels', [])
-
-        # Publish to each requested channel
-        for channel in channels:
-            if channel == 'telegram' and user.get('telegram_chat_id'):
-                # Create notification log entry (status='pending')
-                log_id = create_notification_log(
-                    user_id=user['user_id'],
-                    notification_type='species_detection',
-                    channel='telegram',
-                    trigger_data=event,
-                    message_content=message_content
-                )
-
-                # Create inline keyboard with Map and View buttons
-                buttons_row = []
-
-                # Add Map button if location is available
-                if location:
-                    lat = location.get('lat')
-                    lon = location.get('lon')
-                    if lat and lon:
-                        buttons_row.append({
-                            'text': 'Map',
-                            'url': f'https://maps.google.com/?q={lat},{lon}'
-                        })
-
-                # Add View button
-                buttons_row.append({
-                    'text': 'View',
-                    'url': dashboard_url
-                })
-
-                reply_markup = {
-                    'inline_keyboard': [buttons_row]
-                }
-
-                # Publish to Telegram queue
-                telegram_queue.publish({
-                    'notification_log_id': log_id,
-                    'chat_id': user['telegram_chat_id'],
-                    'message_text': message_content,
-                    'annotated_minio_path': annotated_minio_path,
-                    'reply_markup': reply_markup,
-                })
-
-                logger.info(
-                    "Queued species detection notification",
-                    user_id=user['user_id'],
-                    species=species,
-                    channel='telegram',
-                    log_id=log_id
-                )
-
-
-def handle_low_battery(
-    event: Dict[str, Any],
-    matching_users: List[Dict[str, Any]]
-) -> None:
-    """
-    Handle low battery notification.
-
-    Event schema:
-    {
-        'type': 'low_battery',
-        'camera_id': int,
-        'camera_name': str,
-        'device_id': str,
-        'battery_percentage': int,
-        'location': {'lat': float, 'lon': float} or None,
-        'timestamp': str (ISO 8601)
-    }
-
-    Message format:
-    "Low battery alert: 123456789 at Waterhole North
-    Battery: 25%
-    Location: 51.5074, -0.1278"
-
-    The device id is shown once, followed by the camera's current site so the
-    reader knows where to walk. Falls back to just the device id when the camera
-    has no resolved site.
-    """
-    camera_name = event.get('camera_name')
-    device_id = event.get('device_id')
-    camera_id = event.get('camera_id')
-    battery_percentage = event.get('battery_percentage')
-    location = event.get('location')
-
-    # Validate required fields
-    if not all([camera_name, device_id, battery_percentage is not None]):
-        logger.error("Missing required fields in low_battery event", event=event)
-        return
-
-    # Lead with the device id once (camera_name is the same value), and add the
-    # site so the reader knows where to walk. Falls back to just the device id
-    # when the camera has no resolved site.
-    site_label = get_camera_site_label(camera_id) if camera_id is not None else None
-    header = f"Low battery alert: {device_id}"
-    if site_label:
-        header += f" at {site_label}"
-
-    # Build message text
-    message_lines = [
-        header,
-        f"Battery: {battery_percentage}%"
-    ]
+    # Create inline keyboard with Map and View buttons, the same for every user
+    buttons_row = []
 
+    # Add Map button if location is available
     if location:
         lat = location.get('lat')
         lon = location.get('lon')
         if lat and lon:
-            message_lines.append(f"Location: {lat:.6f}, {lon:.6f}")
-
-    message_content = "\n".join(message_lines)
-
-    logger.info(
-        "Processing low battery notification",
-        camera=camera_name,
-        battery=battery_percentage,
-        user_count=len(matching_users)
-    )
+            buttons_row.append({
+                'text': 'Map',
+                'url': f'https://maps.google.com/?q={lat},{lon}'
+            })
+
+    # Add View button
+    buttons_row.append({
+        'text': 'View',
+        'url': dashboard_url
+    })
+
+    reply_markup = {
+        'inline_keyboard': [buttons_row]
+    }
 
-    # Initialize Telegram queue
-    telegram_queue = RedisQueue(QUEUE_NOTIFICATION_TELEGRAM)
+    # Collect the Telegram messages and push them in one round trip
+    telegram_messages = []
 
     for user in matching_users:
         channels = user.get('channels', [])
@@ -258,27 +155,29 @@ def handle_low_battery(
                 # Create notification log entry (status='pending')
                 log_id = create_notification_log(
                     user_id=user['user_id'],
-                    notification_type='low_battery',
+                    notification_type='species_detection',
                     channel='telegram',
                     trigger_data=event,
                     message_content=message_content
                 )
 
-                # Publish to Telegram queue (no attachment for battery notifications)
-                telegram_queue.publish({
+                telegram_messages.append({
                     'notification_log_id': log_id,
                     'chat_id': user['telegram_chat_id'],
                     'message_text': message_content,
-                    'attachment_path': None,
+                    'annotated_minio_path': annotated_minio_path,
+                    'reply_markup': reply_markup,
                 })
 
-                logger.info(
-                    "Queued low battery notification",
-                    user_id=user['user_id'],
-                    camera=camera_name,
-                    channel='telegram',
-                    log_id=log_id
-                )
+    if telegram_messages:
+        RedisQueue(QUEUE_NOTIFICATION_TELEGRAM).publish_many(telegram_messages)
+
+        logger.info(
+            "Queued species detection notifications",
+            species=species,
+            channel='telegram',
+            log_ids=[message['notification_log_id'] for message in telegram_messages]
+        )
 
 
 def handle_system_health(
@@ -328,8 +227,8 @@ def handle_system_health(
         user_count=len(matching_users)
     )
 
-    # Initialize Telegram queue
-    telegram_queue = RedisQueue(QUEUE_NOTIFICATION_TELEGRAM)
+    # Collect the Telegram messages and push them in one round trip
+    telegram_messages = []
 
     for user in matching_users:
         channels = user.get('channels', [])
@@ -346,18 +245,20 @@ def handle_system_health(
                     message_content=message_content
                 )
 
-                # Publish to Telegram queue (no attachment for system health)
-                telegram_queue.publish({
+                # No attachment for system health
+                telegram_messages.append({
                     'notification_log_id': log_id,
                     'chat_id': user['telegram_chat_id'],
                     'message_text': message_content,
                     'attachment_path': None,
                 })
 
-                logger.info(
-                    "Queued system health notification",
-                    user_id=user['user_id'],
-                    alert_type=alert_type,
-                    channel='telegram',
-                    log_id=log_id
-                )
+    if telegram_messages:
+        RedisQueue(QUEUE_NOTIFICATION_TELEGRAM).publish_many(telegram_messages)
+
+        logger.info(
+            "Queued system health notifications",
+            alert_type=alert_type,
+            channel='telegram',
+            log_ids=[message['notification_log_id'] for message in telegram_messages]
+        )
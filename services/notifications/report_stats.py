@@ -4,9 +4,10 @@ Statistics queries for email reports.
 Uses synchronous database sessions for scheduled job compatibility.
 All queries are filtered by project_id for per-project reports.
 """
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, List, Optional, Tuple
 from datetime import date, datetime, timedelta
-from sqlalchemy import select, func, and_, desc
+from sqlalchemy import select, func, and_, desc, cast, case, Float, Integer
+from sqlalchemy.dialects.postgresql import aggregate_order_by
 from sqlalchemy.orm import Session
 
 from shared.models import (
@@ -19,12 +20,39 @@ from shared.logger import get_logger
 
 logger = get_logger("notifications.report_stats")
 
+_DAY_START = datetime.min.time()
+_DAY_END = datetime.max.time()
+
+
+def _day_range(start_date: date, end_date: date) -> Tuple[datetime, datetime]:
+    """
+    Get the first and last moment of an inclusive date range.
+
+    captured_at is naive camera-clock, interpreted under ServerSettings.timezone,
+    so day boundaries here are naive too.
+    """
+    return datetime.combine(start_date, _DAY_START), datetime.combine(end_date, _DAY_END)
+
+
+def get_detection_threshold(db: Session, project_id: int) -> float:
+    """
+    Get the project detection threshold, 0.5 when the project is missing.
+
+    Selects the one column instead of the full Project row. Report callers
+    resolve it once and pass it to every helper below.
+    """
+    threshold = db.execute(
+        select(Project.detection_threshold).where(Project.id == project_id)
+    ).scalar_one_or_none()
+    return threshold if threshold is not None else 0.5
+
 
 def get_overview_stats(
     db: Session,
     project_id: int,
     start_date: date,
-    end_date: date
+    end_date: date,
+    detection_threshold: Optional[float] = None
 ) -> Dict[str, Any]:
     """
     Get overview statistics for date range.
@@ -34,6 +62,7 @@ def get_overview_stats(
         project_id: Project to query
         start_date: Start of period (inclusive)
         end_date: End of period (inclusive)
+        detection_threshold: Project detection threshold, looked up when None
 
     Returns:
         Dictionary with:
@@ -43,17 +72,10 @@ def get_overview_stats(
         - total_species: Unique species detected (all-time)
         - new_species: Species first detected in date range
     """
-    # Convert dates to datetime for comparison
-    # captured_at is naive camera-clock, interpreted under ServerSettings.timezone,
-    # so day boundaries here are naive too.
-    start_dt = datetime.combine(start_date, datetime.min.time())
-    end_dt = datetime.combine(end_date, datetime.max.time())
-
-    # Get project detection threshold
-    project = db.execute(
-        select(Project).where(Project.id == project_id)
-    ).scalar_one_or_none()
-    detection_threshold = project.detection_threshold if project else 0.5
+    start_dt, end_dt = _day_range(start_date, end_date)
+
+    if detection_threshold is None:
+        detection_threshold = get_detection_threshold(db, project_id)
 
     # Total images (all-time)
     total_images = db.execute(
@@ -81,56 +103,7 @@ def get_overview_stats(
         .where(Camera.project_id == project_id)
     ).scalar_one()
 
-    # Total unique species (all-time)
-    # Prefer human observations for verified images, AI for unverified
-    verified_species_query = (
-        select(HumanObservation.species.label('species'))
-        .join(Image, HumanObservation.image_id == Image.id)
-        .join(Camera, Image.camera_id == Camera.id)
-        .where(
-            and_(
-                Camera.project_id == project_id,
-                Image.is_verified == True
-            )
-        )
-        .distinct()
-    )
-    unverified_species_query = (
-        select(Classification.species.label('species'))
-        .join(Detection, Classification.detection_id == Detection.id)
-        .join(Image, Detection.image_id == Image.id)
-        .join(Camera, Image.camera_id == Camera.id)
-        .join(Project, Camera.project_id == Project.id)
-        .where(
-            and_(
-                Camera.project_id == project_id,
-                Image.is_verified == False,
-                Detection.confidence >= detection_threshold,
-                classification_passes_threshold(),
-            )
-        )
-        .distinct()
-    )
-    pv_species_query = (
-        select(Detection.category.label('species'))
-        .join(Image, Detection.image_id == Image.id)
-        .join(Camera, Image.camera_id == Camera.id)
-        .where(
-            and_(
-                Camera.project_id == project_id,
-                Image.is_verified == False,
-                Detection.category.in_(['person', 'vehicle']),
-                Detection.confidence >= detection_threshold
-            )
-        )
-        .distinct()
-    )
-    combined_species = union_all(verified_species_query, unverified_species_query, pv_species_query).subquery()
-    total_species = db.execute(
-        select(func.count(func.distinct(combined_species.c.species)))
-    ).scalar_one()
-
-    # Species first detected in period
+    # Unique species (all-time) and species first detected in period.
     # Prefer human observations for verified images, AI for unverified
     verified_first_seen = (
         select(
@@ -184,39 +157,45 @@ def get_overview_stats(
         .group_by(Detection.category)
     )
     combined_first_seen = union_all(verified_first_seen, unverified_first_seen, pv_first_seen).subquery()
-    all_species_first_seen = db.execute(
-        select(
-            combined_first_seen.c.species,
-            func.min(combined_first_seen.c.first_seen).label('first_seen')
-        )
+    species_first_seen = (
+        select(func.min(combined_first_seen.c.first_seen).label('first_seen'))
         .group_by(combined_first_seen.c.species)
-    ).all()
-
-    new_species_count = sum(
-        1 for species, first_seen in all_species_first_seen
-        if first_seen and start_dt <= first_seen <= end_dt
+        .subquery()
     )
+    # Count both in SQL, one row comes back however many species there are
+    species_counts = db.execute(
+        select(
+            func.count().label('total_species'),
+            func.count().filter(
+                species_first_seen.c.first_seen.between(start_dt, end_dt)
+            ).label('new_species')
+        )
+        .select_from(species_first_seen)
+    ).one()
 
     return {
         'total_images': total_images,
         'new_images': new_images,
         'total_cameras': total_cameras,
-        'total_species': total_species,
-        'new_species': new_species_count
+        'total_species': species_counts.total_species,
+        'new_species': species_counts.new_species
     }
 
 
-def get_species_distribution(
+def get_species_and_activity(
     db: Session,
     project_id: int,
     start_date: date,
     end_date: date,
-    limit: int = 10
-) -> List[Dict[str, Any]]:
+    limit: int = 10,
+    detection_threshold: Optional[float] = None
+) -> Tuple[List[Dict[str, Any]], Dict[str, Any]]:
     """
-    Get top species by detection count for date range.
+    Get the species distribution and hourly activity in one query.
 
-    Prefers human observations for verified images, falls back to AI for unverified.
+    Both views count the same rows, only grouped differently, so they share
+    one scan with GROUPING SETS ((species), (hour)). Prefers human
+    observations for verified images, falls back to AI for unverified.
 
     Args:
         db: Database session
@@ -224,27 +203,29 @@ def get_species_distribution(
         start_date: Start of period (inclusive)
         end_date: End of period (inclusive)
         limit: Max species to return
+        detection_threshold: Project detection threshold, looked up when None
 
     Returns:
-        List of {'species': str, 'count': int} sorted by count descending
+        Tuple of (species, activity):
+        - species: List of {'species': str, 'count': int} sorted by count descending
+        - activity: Dictionary with total_detections, peak_hour (0-23) and
+          hourly_distribution (list of 24 counts)
     """
-    # captured_at is naive camera-clock, interpreted under ServerSettings.timezone,
-    # so day boundaries here are naive too.
-    start_dt = datetime.combine(start_date, datetime.min.time())
-    end_dt = datetime.combine(end_date, datetime.max.time())
-
-    # Get project detection threshold
-    project = db.execute(
-        select(Project).where(Project.id == project_id)
-    ).scalar_one_or_none()
-    detection_threshold = project.detection_threshold if project else 0.5
+    start_dt, end_dt = _day_range(start_date, end_date)
+
+    if detection_threshold is None:
+        detection_threshold = get_detection_threshold(db, project_id)
+
+    hour = func.extract('hour', Image.captured_at)
 
     # Query 1: Verified images - use HumanObservation.count
     verified_query = (
         select(
             HumanObservation.species.label('species'),
+            hour.label('hour'),
             func.sum(HumanObservation.count).label('count')
         )
+        .select_from(HumanObservation)
         .join(Image, HumanObservation.image_id == Image.id)
         .join(Camera, Image.camera_id == Camera.id)
         .where(
@@ -255,15 +236,17 @@ def get_species_distribution(
                 Image.captured_at <= end_dt
             )
         )
-        .group_by(HumanObservation.species)
+        .group_by(HumanObservation.species, hour)
     )
 
     # Query 2: Unverified images - use AI Classification count
     unverified_query = (
         select(
             Classification.species.label('species'),
+            hour.label('hour'),
             func.count(Classification.id).label('count')
         )
+        .select_from(Classification)
         .join(Detection, Classification.detection_id == Detection.id)
         .join(Image, Detection.image_id == Image.id)
         .join(Camera, Image.camera_id == Camera.id)
@@ -278,15 +261,17 @@ def get_species_distribution(
                 Image.captured_at <= end_dt
             )
         )
-        .group_by(Classification.species)
+        .group_by(Classification.species, hour)
     )
 
     # Query 3: Person/vehicle detections (unverified images)
     pv_query = (
         select(
             Detection.category.label('species'),
+            hour.label('hour'),
             func.count(Detection.id).label('count')
         )
+        .select_from(Detection)
         .join(Image, Detection.image_id == Image.id)
         .join(Camera, Image.camera_id == Camera.id)
         .where(
@@ -299,27 +284,77 @@ def get_species_distribution(
                 Image.captured_at <= end_dt
             )
         )
-        .group_by(Detection.category)
+        .group_by(Detection.category, hour)
     )
 
-    # Combine and aggregate
+    # Combine, then aggregate per species and per hour in the same pass.
+    # GROUPING(species) is 1 on the per-hour rows, 0 on the per-species rows.
+    # The peak hour is the busiest hour row (earliest on ties), picked by a
+    # window over the hour rows so Python does not scan for it.
     combined = union_all(verified_query, unverified_query, pv_query).subquery()
+    is_hour_row = func.grouping(combined.c.species)
+    total_count = func.sum(combined.c.count)
+    peak_hour = func.first_value(combined.c.hour).over(
+        partition_by=is_hour_row,
+        order_by=(combined.c.hour.is_(None), desc(total_count), combined.c.hour)
+    )
     final_query = (
         select(
             combined.c.species,
-            func.sum(combined.c.count).label('total_count')
+            combined.c.hour,
+            is_hour_row.label('is_hour_row'),
+            total_count.label('total_count'),
+            peak_hour.label('peak_hour')
         )
-        .group_by(combined.c.species)
-        .order_by(desc('total_count'))
-        .limit(limit)
+        .group_by(func.grouping_sets(combined.c.species, combined.c.hour))
     )
 
     rows = db.execute(final_query).all()
 
-    return [
-        {'species': row.species, 'count': int(row.total_count)}
-        for row in rows
-    ]
+    species_counts = []
+    hourly_distribution = [0] * 24
+    peak_hour = None
+    for row in rows:
+        if row.is_hour_row:
+            if row.hour is not None:
+                hourly_distribution[int(row.hour)] = int(row.total_count)
+            if row.peak_hour is not None:
+                peak_hour = int(row.peak_hour)
+        else:
+            species_counts.append({'species': row.species, 'count': int(row.total_count)})
+
+    species_counts.sort(key=lambda x: (-x['count'], x['species']))
+
+    total_detections = sum(hourly_distribution)
+
+    activity = {
+        'total_detections': total_detections,
+        'peak_hour': peak_hour,
+        'hourly_distribution': hourly_distribution
+    }
+    return species_counts[:limit], activity
+
+
+def get_species_distribution(
+    db: Session,
+    project_id: int,
+    start_date: date,
+    end_date: date,
+    limit: int = 10,
+    detection_threshold: Optional[float] = None
+) -> List[Dict[str, Any]]:
+    """
+    Get top species by detection count for date range.
+
+    Use get_species_and_activity when the activity summary is needed too.
+
+    Returns:
+        List of {'species': str, 'count': int} sorted by count descending
+    """
+    species, _ = get_species_and_activity(
+        db, project_id, start_date, end_date, limit, detection_threshold
+    )
+    return species
 
 
 def get_camera_health_summary(
@@ -347,93 +382,85 @@ def get_camera_health_summary(
         - high_sd_count: Cameras above SD threshold
         - high_sd_cameras: List of {'name': str, 'sd_percent': int}
     """
-    cameras = db.execute(
-        select(Camera).where(Camera.project_id == project_id)
-    ).scalars().all()
-
-    total = len(cameras)
-    active = 0
-    inactive_cameras = []
-    never_reported_cameras = []
-    low_battery_cameras = []
-    high_sd_cameras = []
-    battery_values = []
-    sd_values = []
-
-    # Pair each camera with the timestamp of its latest health report. reported_at is
-    # naive camera-clock; a few-hour drift from UTC is irrelevant for a 7-day window.
-    camera_ids = [c.id for c in cameras]
-    last_reported_by_camera: dict[int, datetime] = {}
-    if camera_ids:
-        rows = db.execute(
-            select(CameraHealthReport.camera_id, func.max(CameraHealthReport.reported_at))
-            .where(CameraHealthReport.camera_id.in_(camera_ids))
-            .group_by(CameraHealthReport.camera_id)
-        ).all()
-        last_reported_by_camera = {cam_id: ts for cam_id, ts in rows}
+    # Per-camera health values, resolved in SQL. Battery and SD prefer the
+    # direct columns and fall back to the last_health_report in the config
+    # JSON (plain json, so the -> / ->> operator form). reported_at is naive
+    # camera-clock; a few-hour drift from UTC is irrelevant for a 7-day window.
+    health_json = Camera.config.op('->')('last_health_report')
+    config_battery = cast(health_json.op('->>')('battery_percentage'), Float)
+    config_sd_percent = cast(health_json.op('->>')('sd_utilization_percentage'), Float)
+    battery = func.coalesce(Camera.battery_percent, cast(func.trunc(config_battery), Integer))
+    sd_percent = case(
+        (
+            and_(Camera.sd_used_mb.isnot(None), Camera.sd_total_mb > 0),
+            cast(func.trunc(Camera.sd_used_mb * 100.0 / Camera.sd_total_mb), Integer),
+        ),
+        else_=cast(func.trunc(config_sd_percent), Integer),
+    )
+    last_reported_at = (
+        select(func.max(CameraHealthReport.reported_at))
+        .where(CameraHealthReport.camera_id == Camera.id)
+        .scalar_subquery()
+    )
+    camera_health = (
+        select(
+            Camera.device_id.label('name'),
+            last_reported_at.label('last_reported_at'),
+            battery.label('battery'),
+            sd_percent.label('sd_percent'),
+        )
+        .where(Camera.project_id == project_id)
+        .cte('camera_health')
+    )
 
+    # Aggregate everything in one pass. Cameras that never sent a report
+    # have no battery or SD status, so they are left out of those stats.
+    c = camera_health.c
     cutoff = datetime.utcnow() - timedelta(days=7)
+    reported = c.last_reported_at.isnot(None)
+    low_battery = and_(reported, c.battery <= battery_threshold)
+    high_sd = and_(reported, c.sd_percent >= sd_threshold)
 
-    for camera in cameras:
-        last_reported_at = last_reported_by_camera.get(camera.id)
-        if last_reported_at is None:
-            never_reported_cameras.append({'name': camera.device_id})
-            continue
+    def name_list(order_by):
+        return func.json_agg(aggregate_order_by(func.json_build_object('name', c.name), order_by))
 
-        if last_reported_at >= cutoff:
-            active += 1
-        else:
-            inactive_cameras.append({'name': camera.device_id})
-
-        # Check battery - first try direct column, then config
-        battery = camera.battery_percent
-        if battery is None and camera.config:
-            health = camera.config.get('last_health_report', {})
-            battery = health.get('battery_percentage')
-
-        if battery is not None:
-            battery_values.append(battery)
-            if battery <= battery_threshold:
-                low_battery_cameras.append({
-                    'name': camera.device_id,
-                    'battery': battery
-                })
-
-        # Check SD card usage - first try direct columns, then config
-        sd_percent = None
-        if camera.sd_used_mb is not None and camera.sd_total_mb is not None and camera.sd_total_mb > 0:
-            sd_percent = int((camera.sd_used_mb / camera.sd_total_mb) * 100)
-        elif camera.config:
-            health = camera.config.get('last_health_report', {})
-            sd_percent = health.get('sd_utilization_percentage')
-            if sd_percent is not None:
-                sd_percent = int(sd_percent)
-
-        if sd_percent is not None:
-            sd_values.append(sd_percent)
-            if sd_percent >= sd_threshold:
-                high_sd_cameras.append({
-                    'name': camera.device_id,
-                    'sd_percent': sd_percent
-                })
-
-    # Calculate averages
-    avg_battery = int(sum(battery_values) / len(battery_values)) if battery_values else 0
-    avg_sd = int(sum(sd_values) / len(sd_values)) if sd_values else 0
+    row = db.execute(
+        select(
+            func.count().label('total'),
+            func.count().filter(c.last_reported_at >= cutoff).label('active'),
+            name_list(c.name).filter(c.last_reported_at < cutoff).label('inactive_cameras'),
+            name_list(c.name).filter(c.last_reported_at.is_(None)).label('never_reported_cameras'),
+            func.json_agg(aggregate_order_by(
+                func.json_build_object('name', c.name, 'battery', c.battery), c.battery
+            )).filter(low_battery).label('low_battery_cameras'),
+            func.json_agg(aggregate_order_by(
+                func.json_build_object('name', c.name, 'sd_percent', c.sd_percent), c.sd_percent.desc()
+            )).filter(high_sd).label('high_sd_cameras'),
+            func.avg(c.battery).filter(reported).label('avg_battery'),
+            func.avg(c.sd_percent).filter(reported).label('avg_sd'),
+        )
+        .select_from(camera_health)
+    ).one()
+
+    # json_agg returns NULL, not an empty array, when no row passes the filter
+    inactive_cameras = row.inactive_cameras or []
+    never_reported_cameras = row.never_reported_cameras or []
+    low_battery_cameras = row.low_battery_cameras or []
+    high_sd_cameras = row.high_sd_cameras or []
 
     return {
-        'total': total,
-        'active': active,
+        'total': row.total,
+        'active': row.active,
         'inactive': len(inactive_cameras),
         'inactive_cameras': inactive_cameras,
         'never_reported': len(never_reported_cameras),
         'never_reported_cameras': never_reported_cameras,
         'low_battery_count': len(low_battery_cameras),
-        'low_battery_cameras': sorted(low_battery_cameras, key=lambda x: x['battery']),
+        'low_battery_cameras': low_battery_cameras,
         'high_sd_count': len(high_sd_cameras),
-        'high_sd_cameras': sorted(high_sd_cameras, key=lambda x: -x['sd_percent']),
-        'avg_battery': avg_battery,
-        'avg_sd': avg_sd
+        'high_sd_cameras': high_sd_cameras,
+        'avg_battery': int(row.avg_battery) if row.avg_battery is not None else 0,
+        'avg_sd': int(row.avg_sd) if row.avg_sd is not None else 0
     }
 
 
@@ -442,12 +469,16 @@ def get_notable_detections(
     project_id: int,
     start_date: date,
     end_date: date,
-    limit: int = 5
+    limit: int = 5,
+    detection_threshold: Optional[float] = None,
+    per_camera_limit: Optional[int] = None
 ) -> List[Dict[str, Any]]:
     """
     Get notable detections for the period (high confidence or rare species).
 
-    Selects detections with highest confidence scores.
+    Selects detections with highest confidence scores. With per_camera_limit
+    set, each camera contributes at most that many (ranked per camera with
+    row_number()), so one busy camera cannot fill the whole list.
 
     Args:
         db: Database session
@@ -455,20 +486,16 @@ def get_notable_detections(
         start_date: Start of period (inclusive)
         end_date: End of period (inclusive)
         limit: Max detections to return
+        detection_threshold: Project detection threshold, looked up when None
+        per_camera_limit: Max detections per camera (None = no per-camera cap)
 
     Returns:
         List of detection details with species, camera, timestamp, confidence
     """
-    # captured_at is naive camera-clock, interpreted under ServerSettings.timezone,
-    # so day boundaries here are naive too.
-    start_dt = datetime.combine(start_date, datetime.min.time())
-    end_dt = datetime.combine(end_date, datetime.max.time())
-
-    # Get project detection threshold
-    project = db.execute(
-        select(Project).where(Project.id == project_id)
-    ).scalar_one_or_none()
-    detection_threshold = project.detection_threshold if project else 0.5
+    start_dt, end_dt = _day_range(start_date, end_date)
+
+    if detection_threshold is None:
+        detection_threshold = get_detection_threshold(db, project_id)
 
     query = (
         select(
@@ -480,6 +507,7 @@ def get_notable_detections(
             Image.captured_at,
             Image.uuid.label('image_uuid')
         )
+        .select_from(Classification)
         .join(Detection, Classification.detection_id == Detection.id)
         .join(Image, Detection.image_id == Image.id)
         .join(Camera, Image.camera_id == Camera.id)
@@ -495,10 +523,24 @@ def get_notable_detections(
                 Image.captured_at <= end_dt
             )
         )
-        .order_by(desc(Classification.confidence))
-        .limit(limit)
     )
 
+    if per_camera_limit is None:
+        query = query.order_by(desc(Classification.confidence)).limit(limit)
+    else:
+        ranked = query.add_columns(
+            func.row_number().over(
+                partition_by=Camera.id,
+                order_by=desc(Classification.confidence)
+            ).label('camera_rank')
+        ).subquery()
+        query = (
+            select(ranked)
+            .where(ranked.c.camera_rank <= per_camera_limit)
+            .order_by(desc(ranked.c.classification_confidence))
+            .limit(limit)
+        )
+
     rows = db.execute(query).all()
 
     # Lead with the site (the place); fall back to the device id when the image
@@ -520,19 +562,13 @@ def get_activity_summary(
     db: Session,
     project_id: int,
     start_date: date,
-    end_date: date
+    end_date: date,
+    detection_threshold: Optional[float] = None
 ) -> Dict[str, Any]:
     """
     Get activity pattern summary for the period.
 
-    Analyzes hourly detection distribution to find peak activity times.
-    Prefers human observations for verified images, falls back to AI for unverified.
-
-    Args:
-        db: Database session
-        project_id: Project to query
-        start_date: Start of period (inclusive)
-        end_date: End of period (inclusive)
+    Use get_species_and_activity when the species distribution is needed too.
 
     Returns:
         Dictionary with:
@@ -540,109 +576,10 @@ def get_activity_summary(
         - peak_hour: Hour with most activity (0-23)
         - hourly_distribution: List of 24 counts
     """
-    # captured_at is naive camera-clock, interpreted under ServerSettings.timezone,
-    # so day boundaries here are naive too.
-    start_dt = datetime.combine(start_date, datetime.min.time())
-    end_dt = datetime.combine(end_date, datetime.max.time())
-
-    # Get project detection threshold
-    project = db.execute(
-        select(Project).where(Project.id == project_id)
-    ).scalar_one_or_none()
-    detection_threshold = project.detection_threshold if project else 0.5
-
-    # Query 1: Verified images - use HumanObservation.count
-    verified_query = (
-        select(
-            func.extract('hour', Image.captured_at).label('hour'),
-            func.sum(HumanObservation.count).label('count')
-        )
-        .select_from(HumanObservation)
-        .join(Image, HumanObservation.image_id == Image.id)
-        .join(Camera, Image.camera_id == Camera.id)
-        .where(
-            and_(
-                Camera.project_id == project_id,
-                Image.is_verified == True,
-                Image.captured_at >= start_dt,
-                Image.captured_at <= end_dt
-            )
-        )
-        .group_by(func.extract('hour', Image.captured_at))
-    )
-
-    # Query 2: Unverified images - use AI Classification count
-    unverified_query = (
-        select(
-            func.extract('hour', Image.captured_at).label('hour'),
-            func.count(Classification.id).label('count')
-        )
-        .select_from(Classification)
-        .join(Detection, Classification.detection_id == Detection.id)
-        .join(Image, Detection.image_id == Image.id)
-        .join(Camera, Image.camera_id == Camera.id)
-        .join(Project, Camera.project_id == Project.id)
-        .where(
-            and_(
-                Camera.project_id == project_id,
-                Image.is_verified == False,
-                Detection.confidence >= detection_threshold,
-                classification_passes_threshold(),
-                Image.captured_at >= start_dt,
-                Image.captured_at <= end_dt
-            )
-        )
-        .group_by(func.extract('hour', Image.captured_at))
+    _, activity = get_species_and_activity(
+        db, project_id, start_date, end_date, detection_threshold=detection_threshold
     )
-
-    # Query 3: Person/vehicle detections (unverified images)
-    pv_query = (
-        select(
-            func.extract('hour', Image.captured_at).label('hour'),
-            func.count(Detection.id).label('count')
-        )
-        .select_from(Detection)
-        .join(Image, Detection.image_id == Image.id)
-        .join(Camera, Image.camera_id == Camera.id)
-        .where(
-            and_(
-                Camera.project_id == project_id,
-                Image.is_verified == False,
-                Detection.category.in_(['person', 'vehicle']),
-                Detection.confidence >= detection_threshold,
-                Image.captured_at >= start_dt,
-                Image.captured_at <= end_dt
-            )
-        )
-        .group_by(func.extract('hour', Image.captured_at))
-    )
-
-    # Combine and aggregate by hour
-    combined = union_all(verified_query, unverified_query, pv_query).subquery()
-    final_query = (
-        select(
-            combined.c.hour,
-            func.sum(combined.c.count).label('total_count')
-        )
-        .group_by(combined.c.hour)
-    )
-
-    rows = db.execute(final_query).all()
-
-    # Build 24-hour distribution
-    hourly_distribution = [0] * 24
-    for row in rows:
-        if row.hour is not None:
-            hourly_distribution[int(row.hour)] = int(row.total_count)
-
-    total_detections = sum(hourly_distribution)
-    peak_hour = hourly_distribution.index(max(hourly_distribution)) if total_detections > 0 else None
-
-    return {
-        'total_detections': total_detections,
-        'peak_hour': peak_hour,
-        'hourly_distribution': hourly_distribution
-    }
+    return activity
 
 
 def get_images_timeline(
@@ -663,10 +600,7 @@ def get_images_timeline(
     Returns:
         List of {'date': str, 'count': int} sorted by date
     """
-    # captured_at is naive camera-clock, interpreted under ServerSettings.timezone,
-    # so day boundaries here are naive too.
-    start_dt = datetime.combine(start_date, datetime.min.time())
-    end_dt = datetime.combine(end_date, datetime.max.time())
+    start_dt, end_dt = _day_range(start_date, end_date)
 
     query = (
         select(
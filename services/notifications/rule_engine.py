@@ -3,25 +3,105 @@ Notification rule engine
 
 Evaluates which users should be notified for a given event, and through which channels.
 """
-from typing import Dict, Any, List
-from sqlalchemy import select, cast, or_
-from sqlalchemy.dialects.postgresql import JSONB
+import time
+from contextlib import contextmanager
+from typing import Callable, Dict, Any, FrozenSet, Iterator, List, Optional, Tuple
+from sqlalchemy import select, bindparam, Text
+from sqlalchemy.dialects.postgresql import JSONB, ARRAY
+from sqlalchemy.engine import Row
 from sqlalchemy.orm import Session
 
 from shared.logger import get_logger
 from shared.models import ProjectNotificationPreference, User, Project
 from shared.database import get_sync_session
+from shared.classification_threshold import effective_classification_threshold
 from db_operations import get_image_site_id
 
 logger = get_logger("notifications.rules")
 
+# How long preference lookups are reused across events, in seconds
+CANDIDATES_CACHE_TTL_SECONDS = 30
+
+# (project_id, event_type, species) -> (expires_at, (project, preferences))
+_candidates_cache: Dict[Tuple[int, str, Optional[str]], Tuple[float, Tuple[Row, List[Row]]]] = {}
+
+# Projects with any subscriber, refreshed at most once per TTL. Events of
+# other projects return without a per-event query.
+_subscribed_projects: Tuple[float, FrozenSet[int]] = (0.0, frozenset())
+
+# The lookups are built once here with bound parameters, so every call
+# reuses the same statement and SQLAlchemy's compiled SQL cache.
+_channels_json = ProjectNotificationPreference.notification_channels
+
+# Preferences that can ever match: active, verified user with Telegram and a
+# channels config. Nothing is read from User, so filter with IN (subquery)
+# and let the planner use a semi-join instead of joining in the user rows.
+_SUBSCRIBER_FILTERS = (
+    ProjectNotificationPreference.user_id.in_(
+        select(User.id).where(User.is_active == True, User.is_verified == True)
+    ),
+    ProjectNotificationPreference.telegram_chat_id.isnot(None),
+    ProjectNotificationPreference.notification_channels.isnot(None),
+)
+
+# Rows are plain columns, so they stay usable after the session closes
+_PREFERENCE_ROWS = (
+    select(
+        ProjectNotificationPreference.user_id,
+        ProjectNotificationPreference.telegram_chat_id,
+        ProjectNotificationPreference.notification_channels,
+    )
+    .where(*_SUBSCRIBER_FILTERS)
+)
+
+# Projects with at least one possible subscriber
+_SUBSCRIBED_PROJECTS_STMT = (
+    select(ProjectNotificationPreference.project_id)
+    .where(*_SUBSCRIBER_FILTERS)
+    .distinct()
+)
+
+# Thresholds of one project
+_PROJECT_STMT = (
+    select(Project.detection_threshold, Project.classification_thresholds)
+    .where(Project.id == bindparam('project_id'))
+)
+
+# Preferences of one project whose notification_channels contain 'required'
+_PREFERENCES_STMT = _PREFERENCE_ROWS.where(
+    ProjectNotificationPreference.project_id == bindparam('project_id'),
+    _channels_json.contains(bindparam('required', type_=JSONB))
+)
+
+# Thresholds of several projects, for batches
+_PROJECTS_BATCH_STMT = (
+    select(Project.id, Project.detection_threshold, Project.classification_thresholds)
+    .where(Project.id.in_(bindparam('project_ids', expanding=True)))
+)
+
+# Species detection preferences of several projects listing any of 'species'
+_SPECIES_BATCH_STMT = (
+    _PREFERENCE_ROWS
+    .add_columns(ProjectNotificationPreference.project_id)
+    .where(
+        ProjectNotificationPreference.project_id.in_(bindparam('project_ids', expanding=True)),
+        _channels_json.contains(
+            {'species_detection': {'enabled': True, 'channels': ['telegram']}}
+        ),
+        _channels_json['species_detection']['notify_species'].op('?|')(
+            bindparam('species', type_=ARRAY(Text))
+        )
+    )
+)
 
-def get_matching_users(event: Dict[str, Any]) -> List[Dict[str, Any]]:
+
+def get_matching_users(event: Dict[str, Any], session: Optional[Session] = None) -> List[Dict[str, Any]]:
     """
     Get list of users who should be notified for this event, with their channel preferences.
 
     Args:
         event: Notification event
+        session: Session to run the lookups on, a new one is opened when None
 
     Returns:
         List of dictionaries with user_id, telegram_chat_id, and channels array
@@ -36,8 +116,8 @@ def get_matching_users(event: Dict[str, Any]) -> List[Dict[str, Any]]:
 
     Rules:
     - Uses notification_channels JSON field for per-type channel selection
-    - Legacy fields no longer supported (only Telegram)
-    - Species detection: checks notify_species list in JSON
+    - Rows without notification_channels (legacy fields) are skipped in SQL
+    - Species detection: notify_species must contain the species (checked in SQL)
     - System health: checks enabled flag in JSON
 
     All rules also check:
@@ -55,84 +135,271 @@ def get_matching_users(event: Dict[str, Any]) -> List[Dict[str, Any]]:
         logger.error("Missing project_id in event", event_type=event_type)
         return []
 
-    with get_sync_session() as session:
-        # Load project to get detection_threshold
-        project = session.execute(
-            select(Project).where(Project.id == project_id)
-        ).scalar_one_or_none()
+    event_passes = _EVENT_CHECKS.get(event_type)
+    if event_passes is None:
+        logger.warning("Unknown event type", event_type=event_type)
+        return []
 
-        if not project:
-            logger.error("Project not found", project_id=project_id)
+    # The event type must be enabled with Telegram as a channel, and for
+    # species detections notify_species must list the species. A null or
+    # missing notify_species never matches. The containment check is served
+    # by the GIN index on notification_channels.
+    required = {'enabled': True, 'channels': ['telegram']}
+    species = None
+    if event_type == 'species_detection':
+        species = event.get('species')
+        if not species:
+            logger.error("Missing species in species_detection event")
             return []
+        required['notify_species'] = [species]
 
-        # Base query: user is active and verified, has Telegram configured
-        query = (
-            select(ProjectNotificationPreference)
-            .join(User, ProjectNotificationPreference.user_id == User.id)
-            .where(
-                ProjectNotificationPreference.project_id == project_id,
-                User.is_active == True,
-                User.is_verified == True,
-                ProjectNotificationPreference.telegram_chat_id.isnot(None)
-            )
+    if project_id not in _subscribed_project_ids(session):
+        return []
+
+    loaded = _load_candidates(project_id, event_type, species, required, session)
+    if loaded is None:
+        logger.error("Project not found", project_id=project_id)
+        return []
+    project, preferences = loaded
+
+    if not preferences or not event_passes(event, project):
+        return []
+
+    # Resolve the image's site once, and only if some candidate scopes by site
+    site_id = None
+    image_uuid = event.get('image_uuid')
+    if image_uuid and event_type == 'species_detection' and any(
+        (pref.notification_channels.get(event_type) or {}).get('notify_sites') is not None
+        for pref in preferences
+    ):
+        site_id = get_image_site_id(image_uuid)
+
+    matching_users = []
+    for pref in preferences:
+        result = _evaluate_json_preferences(pref, event_type, pref.notification_channels, site_id)
+        if result:
+            matching_users.append(result)
+
+    # Most events match nobody, so only log those at DEBUG
+    if matching_users:
+        logger.info(
+            "Evaluated notification rules",
+            event_type=event_type,
+            matching_count=len(matching_users)
         )
+    else:
+        logger.debug("Evaluated notification rules", event_type=event_type, matching_count=0)
 
-        # Execute query to get all preferences for this project
-        preferences = list(session.execute(query).scalars().all())
+    return matching_users
 
-        # Filter in Python based on notification_channels JSON
-        matching_users = []
 
-        for pref in preferences:
-            # Parse notification_channels JSON
-            channels_config = pref.notification_channels
+def _load_candidates(
+    project_id: int,
+    event_type: str,
+    species: Optional[str],
+    required: Dict[str, Any],
+    session: Optional[Session],
+) -> Optional[Tuple[Row, List[Row]]]:
+    """
+    Load the project thresholds and the preference rows that pass the SQL filter.
 
-            # If notification_channels is None, fall back to legacy fields
-            if channels_config is None:
-                result = _evaluate_legacy_preferences(pref, event_type, event, project)
-                if result:
-                    matching_users.append(result)
-                continue
+    A camera often uploads a burst of images of the same species, so the
+    result is cached for a short time per (project_id, event_type, species).
+    Preference changes made in the API show up once the entry expires.
 
-            # Use JSON configuration
-            result = _evaluate_json_preferences(pref, event_type, event, channels_config, project)
-            if result:
-                matching_users.append(result)
+    Returns None if the project does not exist.
+    """
+    key = (project_id, event_type, species)
+    now = time.monotonic()
+    cached = _cache_get(key, now)
+    if cached:
+        return cached
+
+    with _session_scope(session) as session:
+        # Load only the project thresholds the rules compare against
+        project = session.execute(
+            _PROJECT_STMT, {'project_id': project_id}
+        ).one_or_none()
 
-    logger.info(
-        "Evaluated notification rules",
-        event_type=event_type,
-        matching_count=len(matching_users)
-    )
+        if not project:
+            return None
 
-    return matching_users
+        preferences = list(session.execute(
+            _PREFERENCES_STMT,
+            {'project_id': project_id, 'required': {event_type: required}}
+        ).all())
 
+    _cache_put(key, (project, preferences), now)
+    return project, preferences
 
-def _evaluate_legacy_preferences(
-    pref: ProjectNotificationPreference,
-    event_type: str,
-    event: Dict[str, Any],
-    project: Project
-) -> Dict[str, Any]:
+
+def prefetch_matching_users(events: List[Dict[str, Any]], session: Optional[Session] = None) -> None:
     """
-    Evaluate using legacy boolean fields (backward compatibility)
+    Fill the candidates cache for a batch of species_detection events.
 
-    Returns user dict if matches, None otherwise
+    Call before get_matching_users on each event of the batch, which then
+    finds its lookups in the cache.
 
-    Legacy preferences only supported Signal, which is no longer available.
-    This function now returns None for all cases.
+    Resolves every uncached (project_id, species) pair in the batch with one
+    thresholds query and one preferences query, instead of two queries per
+    pair. notify_species is matched with the jsonb ?| (any of) operator, and
+    the rows are then split per pair in Python.
     """
-    # Legacy fields only supported Signal, no longer available
+    now = time.monotonic()
+    keys = {
+        (event['project_id'], 'species_detection', event['species'])
+        for event in events
+        if event.get('event_type') == 'species_detection'
+        and event.get('project_id') and event.get('species')
+    }
+    keys = {key for key in keys if not _cache_get(key, now)}
+    if keys:
+        subscribed = _subscribed_project_ids(session)
+        keys = {key for key in keys if key[0] in subscribed}
+    # A single pair gains nothing over the regular lookup
+    if len(keys) < 2:
+        return
+
+    project_ids = sorted({project_id for project_id, _, _ in keys})
+    species_list = sorted({species for _, _, species in keys})
+
+    with _session_scope(session) as session:
+        projects = {
+            row.id: row for row in session.execute(
+                _PROJECTS_BATCH_STMT, {'project_ids': project_ids}
+            ).all()
+        }
+        rows = session.execute(
+            _SPECIES_BATCH_STMT,
+            {'project_ids': project_ids, 'species': species_list}
+        ).all()
+
+    preferences_by_key: Dict[Tuple[int, str, Optional[str]], List[Row]] = {key: [] for key in keys}
+    for row in rows:
+        notify_species = row.notification_channels['species_detection']['notify_species']
+        # Each row once per species, like the per-event lookup; ?| only matches strings
+        for species in {s for s in notify_species if isinstance(s, str)}:
+            key = (row.project_id, 'species_detection', species)
+            if key in preferences_by_key:
+                preferences_by_key[key].append(row)
+
+    for key, preferences in preferences_by_key.items():
+        # Missing projects are left uncached, the regular lookup reports them
+        if key[0] in projects:
+            _cache_put(key, (projects[key[0]], preferences), now)
+
+
+def _subscribed_project_ids(session: Optional[Session]) -> FrozenSet[int]:
+    """
+    Ids of projects with at least one user who could be notified.
+
+    Most projects have no subscribers, and their events would otherwise each
+    run a preference query that returns nothing. Preference changes show up
+    once the set expires, like the candidates cache.
+    """
+    global _subscribed_projects
+    now = time.monotonic()
+    expires_at, project_ids = _subscribed_projects
+    if expires_at > now:
+        return project_ids
+
+    with _session_scope(session) as session:
+        project_ids = frozenset(session.execute(_SUBSCRIBED_PROJECTS_STMT).scalars().all())
+    _subscribed_projects = (now + CANDIDATES_CACHE_TTL_SECONDS, project_ids)
+    return project_ids
+
+
+@contextmanager
+def _session_scope(session: Optional[Session]) -> Iterator[Session]:
+    """Yield the caller's session, or a new one that is closed afterwards."""
+    if session is not None:
+        yield session
+        return
+    with get_sync_session() as new_session:
+        yield new_session
+
+
+def _cache_get(key: Tuple[int, str, Optional[str]], now: float) -> Optional[Tuple[Row, List[Row]]]:
+    """Return the live cache entry for key, or None."""
+    cached = _candidates_cache.get(key)
+    if cached and cached[0] > now:
+        return cached[1]
     return None
 
 
+def _cache_put(key: Tuple[int, str, Optional[str]], value: Tuple[Row, List[Row]], now: float) -> None:
+    """Store a cache entry, dropping expired ones so the cache stays bounded by the live keys."""
+    for stale in [k for k, (expires, _) in _candidates_cache.items() if expires <= now]:
+        del _candidates_cache[stale]
+    _candidates_cache[key] = (now + CANDIDATES_CACHE_TTL_SECONDS, value)
+
+
+def _species_detection_passes(event: Dict[str, Any], project: Row) -> bool:
+    """
+    Check the species_detection event against the project thresholds.
+
+    Depends only on the event and project, so it runs once per event
+    rather than once per preference row.
+    """
+    species = event.get('species')
+
+    # Check detection confidence vs project threshold
+    # Use detection_confidence (MegaDetector) if available, fall back to classification confidence
+    confidence = event.get('detection_confidence', event.get('confidence'))
+    if confidence is None:
+        logger.warning("Missing confidence in species_detection event")
+        return False
+
+    if confidence < project.detection_threshold:
+        logger.debug(
+            "Detection below threshold, skipping notification",
+            confidence=confidence,
+            threshold=project.detection_threshold,
+            species=species
+        )
+        return False
+
+    # Per-species classification confidence threshold. The event carries
+    # both detection_confidence (MegaDetector) and confidence (the
+    # classification confidence). Compare the latter against the
+    # project's per-species classification threshold so notifications
+    # don't fire for sub-threshold classifications that are hidden
+    # from every other view.
+    classification_confidence = event.get('confidence')
+    if classification_confidence is not None:
+        cls_threshold = effective_classification_threshold(
+            project.classification_thresholds, species,
+        )
+        if classification_confidence < cls_threshold:
+            logger.debug(
+                "Classification below per-species threshold, skipping notification",
+                classification_confidence=classification_confidence,
+                threshold=cls_threshold,
+                species=species,
+            )
+            return False
+
+    return True
+
+
+def _system_health_passes(event: Dict[str, Any], project: Row) -> bool:
+    """System health events only need the type enabled, which SQL already checked."""
+    return True
+
+
+# Event-level checks per supported event type. Types missing here match nobody.
+_EVENT_CHECKS: Dict[str, Callable[[Dict[str, Any], Row], bool]] = {
+    'species_detection': _species_detection_passes,
+    'system_health': _system_health_passes,
+}
+
+
 def _evaluate_json_preferences(
-    pref: ProjectNotificationPreference,
+    pref: Row,
     event_type: str,
-    event: Dict[str, Any],
     channels_config: Dict[str, Any],
-    project: Project
-) -> Dict[str, Any]:
+    site_id: Optional[int]
+) -> Optional[Dict[str, Any]]:
     """
     Evaluate using notification_channels JSON configuration
 
@@ -161,17 +428,7 @@ def _evaluate_json_preferences(
     if not valid_channels:
         return None
 
-    # Event-specific validation
     if event_type == 'species_detection':
-        species = event.get('species')
-        if not species:
-            return None
-
-        # Check notify_species: must be a non-empty list containing the species
-        notify_species = type_config.get('notify_species')
-        if not notify_species or species not in notify_species:
-            return None
-
         # Site scope mirrors notify_species: when present the list must contain
         # the event image's site, otherwise the event is dropped. An empty list
         # silences every site. Missing key or null is the legacy bypass for rows
@@ -181,56 +438,9 @@ def _evaluate_json_preferences(
         # scoped user (but still reaches users with no scope set).
         notify_sites = type_config.get('notify_sites')
         if notify_sites is not None:
-            image_uuid = event.get('image_uuid')
-            site_id = get_image_site_id(image_uuid) if image_uuid else None
             if site_id is None or site_id not in notify_sites:
                 return None
 
-        # Check detection confidence vs project threshold
-        # Use detection_confidence (MegaDetector) if available, fall back to classification confidence
-        confidence = event.get('detection_confidence', event.get('confidence'))
-        if confidence is None:
-            logger.warning("Missing confidence in species_detection event")
-            return None
-
-        if confidence < project.detection_threshold:
-            logger.debug(
-                "Detection below threshold, skipping notification",
-                confidence=confidence,
-                threshold=project.detection_threshold,
-                species=species
-            )
-            return None
-
-        # Per-species classification confidence threshold. The event carries
-        # both detection_confidence (MegaDetector) and confidence (the
-        # classification confidence). Compare the latter against the
-        # project's per-species classification threshold so notifications
-        # don't fire for sub-threshold classifications that are hidden
-        # from every other view.
-        from shared.classification_threshold import effective_classification_threshold
-        classification_confidence = event.get('confidence')
-        if classification_confidence is not None:
-            cls_threshold = effective_classification_threshold(
-                project.classification_thresholds, species,
-            )
-            if classification_confidence < cls_threshold:
-                logger.debug(
-                    "Classification below per-species threshold, skipping notification",
-                    classification_confidence=classification_confidence,
-                    threshold=cls_threshold,
-                    species=species,
-                )
-                return None
-
-    elif event_type == 'system_health':
-        # Just needs to be enabled (already checked above)
-        pass
-
-    else:
-        logger.warning("Unknown event type", event_type=event_type)
-        return None
-
     return {
         'user_id': pref.user_id,
         'telegram_chat_id': pref.telegram_chat_id,
@@ -14,15 +14,15 @@ Also runs scheduled jobs (15-minute spacing convention):
 - Camera condition alert rules daily at 07:00 UTC
 - Disk usage alert check hourly
 """
-from typing import Dict, Any
+from typing import Callable, Dict, Any, List
 from apscheduler.schedulers.background import BackgroundScheduler
 
 from shared.logger import get_logger
 from shared.queue import RedisQueue, QUEUE_NOTIFICATION_EVENTS
 from shared.config import get_settings
 
-from rule_engine import get_matching_users
-from event_handlers import handle_species_detection, handle_low_battery, handle_system_health
+from rule_engine import get_matching_users, prefetch_matching_users
+from event_handlers import handle_species_detection, handle_system_health
 from camera_alerts import send_camera_condition_alerts
 from email_report import send_daily_reports, send_weekly_reports, send_monthly_reports
 from excessive_images import send_excessive_image_alerts
@@ -35,6 +35,12 @@ from infra_alert import check_infra_alerts
 logger = get_logger("notifications")
 settings = get_settings()
 
+# Handler per event type
+EVENT_HANDLERS: Dict[str, Callable[[Dict[str, Any], List[Dict[str, Any]]], None]] = {
+    'species_detection': handle_species_detection,
+    'system_health': handle_system_health,
+}
+
 
 def process_notification_event(event: Dict[str, Any]) -> None:
     """
@@ -45,7 +51,7 @@ def process_notification_event(event: Dict[str, Any]) -> None:
 
     Expected event structure:
     {
-        'event_type': 'species_detection' | 'low_battery' | 'system_health',
+        'event_type': 'species_detection' | 'system_health',
         ... (type-specific fields)
     }
     """
@@ -76,12 +82,9 @@ def process_notification_event(event: Dict[str, Any]) -> None:
         )
 
         # Route to appropriate event handler
-        if event_type == 'species_detection':
-            handle_species_detection(event, matching_users)
-        elif event_type == 'low_battery':
-            handle_low_battery(event, matching_users)
-        elif event_type == 'system_health':
-            handle_system_health(event, matching_users)
+        handler = EVENT_HANDLERS.get(event_type)
+        if handler:
+            handler(event, matching_users)
         else:
             logger.error("Unknown event type", event_type=event_type)
 
@@ -95,6 +98,46 @@ def process_notification_event(event: Dict[str, Any]) -> None:
         raise
 
 
+def process_notification_batch(
+    events: List[Dict[str, Any]],
+    dead_letter: Callable[[Dict[str, Any], Exception], None],
+) -> None:
+    """
+    Process a batch of notification events taken from the queue together.
+
+    The preference lookups for the whole batch run first, so a burst of
+    species detections costs one query instead of one per event. That
+    prefetch runs in its own short session, and each event then does any
+    remaining lookups in its own, so no transaction stays open across the
+    Telegram and email sends. A failing event is dead-lettered on its own
+    and does not stop the rest of the batch. If the prefetch fails, nothing
+    has been sent yet, so the whole batch is dead-lettered.
+
+    Args:
+        events: Notification events, in queue order
+        dead_letter: Called with each event that fails and its error
+    """
+    try:
+        prefetch_matching_users(events)
+    except Exception as e:
+        logger.error(
+            "Failed to prefetch notification rules",
+            batch_size=len(events),
+            error=str(e),
+            exc_info=True
+        )
+        for event in events:
+            dead_letter(event, e)
+        return
+
+    for event in events:
+        try:
+            process_notification_event(event)
+        except Exception as e:
+            # Already logged with the traceback in process_notification_event
+            dead_letter(event, e)
+
+
 def main() -> None:
     """Main entry point for notifications service"""
     logger.info("Starting notifications service")
@@ -223,7 +266,7 @@ def main() -> None:
     logger.info("Listening for notification events")
 
     try:
-        queue.consume_forever(process_notification_event)
+        queue.consume_forever_batch(process_notification_batch)
     except KeyboardInterrupt:
         logger.info("Shutting down notifications service")
         scheduler.shutdown()
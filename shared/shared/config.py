@@ -18,6 +18,14 @@ class Settings(BaseSettings):
 
     # Database
     database_url: str
+    db_pool_size: int = 5
+    db_max_overflow: int = 10
+    db_pool_timeout: int = 30  # Seconds to wait for a free connection
+    db_pool_recycle: int = 1800  # Seconds before a pooled connection is replaced
+    db_pool_pre_ping: bool = True  # Test connections on checkout, turn off behind a transaction-mode pooler
+    db_statement_cache_size: int = 500  # asyncpg prepared statements per connection, 0 for a transaction-mode pooler
+    db_query_cache_size: int = 1200  # Compiled SQL kept per engine by SQLAlchemy
+    db_echo: bool = False  # Log every SQL statement, for local debugging only
 
     # Redis
     redis_url: str
@@ -2,7 +2,22 @@
 Database session management with SQLAlchemy
 
 Provides database connection and session management for all services.
+
+Each process gets its own pool, sized by settings so a service can be tuned
+in its environment without code changes:
+- DB_POOL_SIZE (5) and DB_MAX_OVERFLOW (10): connections kept and extra allowed
+- DB_POOL_TIMEOUT (30): seconds to wait for a free connection before failing
+- DB_POOL_RECYCLE (1800): seconds before a connection is replaced
+- DB_POOL_PRE_PING (true): test connections on checkout
+- DB_STATEMENT_CACHE_SIZE (500): prepared statements kept per async connection
+- DB_QUERY_CACHE_SIZE (1200): compiled SQL strings kept per engine
+Keep size + overflow summed over all processes below Postgres max_connections.
+
+Both session factories use expire_on_commit=False: objects keep their loaded
+values after commit instead of re-selecting on next access. Sessions are
+short-lived, so call db.refresh(obj) if you need values changed elsewhere.
 """
+import orjson
 from sqlalchemy import create_engine
 from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
 from sqlalchemy.orm import sessionmaker, declarative_base
@@ -13,27 +28,43 @@ from .config import get_settings
 
 settings = get_settings()
 
-# Create synchronous SQLAlchemy engine (for workers)
-engine = create_engine(
-    settings.database_url,
-    pool_pre_ping=True,
-    pool_size=5,
-    max_overflow=10,
-    echo=settings.log_level == "DEBUG"
+
+def _json_dumps(value) -> str:
+    """Encode JSON column values with orjson; int dict keys become strings like json.dumps."""
+    return orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS).decode()
+
+# Engine settings shared by both engines, tunable per service from the environment.
+# SQL echo is its own switch so LOG_LEVEL=DEBUG does not also log every statement.
+_engine_options = dict(
+    pool_pre_ping=settings.db_pool_pre_ping,
+    pool_size=settings.db_pool_size,
+    max_overflow=settings.db_max_overflow,
+    pool_timeout=settings.db_pool_timeout,
+    pool_recycle=settings.db_pool_recycle,
+    query_cache_size=settings.db_query_cache_size,
+    # JSON and JSONB columns (image metadata, bboxes, notification settings)
+    # are encoded and decoded with orjson instead of the stdlib json module.
+    json_serializer=_json_dumps,
+    json_deserializer=orjson.loads,
+    echo=settings.db_echo,
 )
 
+# Create synchronous SQLAlchemy engine (for workers)
+engine = create_engine(settings.database_url, **_engine_options)
+
 # Create async SQLAlchemy engine (for FastAPI)
 async_database_url = settings.database_url.replace("postgresql://", "postgresql+asyncpg://")
+# The asyncpg dialect keeps prepared statements per connection; the API's
+# ORM queries outnumber the default 100 slots. 0 turns it off, which a
+# transaction-mode pooler needs.
 async_engine = create_async_engine(
     async_database_url,
-    pool_pre_ping=True,
-    pool_size=5,
-    max_overflow=10,
-    echo=settings.log_level == "DEBUG"
+    connect_args={"prepared_statement_cache_size": settings.db_statement_cache_size},
+    **_engine_options,
 )
 
 # Session factories
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+SessionLocal = sessionmaker(autocommit=False, autoflush=False, expire_on_commit=False, bind=engine)
 AsyncSessionLocal = sessionmaker(
     async_engine,
     class_=AsyncSession,
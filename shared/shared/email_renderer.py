@@ -9,11 +9,13 @@ from pathlib import Path
 from jinja2 import Environment, FileSystemLoader
 
 
-# Set up Jinja2 template environment
+# Set up Jinja2 template environment. Templates ship inside the image and
+# never change at runtime, so skip the stat() per render that auto_reload does.
 TEMPLATE_DIR = Path(__file__).parent / "templates"
 _jinja_env = Environment(
     loader=FileSystemLoader(str(TEMPLATE_DIR)),
-    autoescape=True
+    autoescape=True,
+    auto_reload=False,
 )
 
 
@@ -34,53 +36,61 @@ def render_email(template_name: str, **context) -> Tuple[str, str]:
     return html_content, text_content
 
 
+# Patterns for _html_to_text, compiled once at import
+_RE_STYLE_SCRIPT = re.compile(r'<(style|script)[^>]*>.*?</\1>', re.DOTALL | re.IGNORECASE)
+_RE_LINK = re.compile(r'<a[^>]*href=["\']([^"\']*)["\'][^>]*>([^<]*)</a>', re.IGNORECASE)
+_RE_HEADER = re.compile(r'<h[1-6][^>]*>([^<]*)</h[1-6]>', re.IGNORECASE)
+_RE_BLOCK = re.compile(r'<(?:p|div)[^>]*>|</(?:p|div)>|<br\s*/?>', re.IGNORECASE)
+_RE_LIST_ITEM = re.compile(r'<li[^>]*>', re.IGNORECASE)
+_RE_TAG = re.compile(r'<[^>]+>')
+_RE_SPACES = re.compile(r'[ \t]+')
+_RE_BLANK_LINES = re.compile(r'\n\s*\n\s*\n+')
+
+# Common HTML entities, decoded in one pass
+_ENTITIES = {
+    'nbsp': ' ',
+    'amp': '&',
+    'lt': '<',
+    'gt': '>',
+    'quot': '"',
+    '#39': "'",
+    'mdash': '-',
+    'ndash': '-',
+}
+_RE_ENTITY = re.compile(r'&(' + '|'.join(_ENTITIES) + r');')
+
+
 def _html_to_text(html: str) -> str:
     """
     Convert HTML email to plain text fallback.
 
     Simple conversion that preserves readability.
     """
-    text = html
-
-    # Remove style tags and content
-    text = re.sub(r'<style[^>]*>.*?</style>', '', text, flags=re.DOTALL | re.IGNORECASE)
-
-    # Remove script tags and content
-    text = re.sub(r'<script[^>]*>.*?</script>', '', text, flags=re.DOTALL | re.IGNORECASE)
+    # Remove style and script tags and content
+    text = _RE_STYLE_SCRIPT.sub('', html)
 
     # Convert links to text with URL
-    text = re.sub(r'<a[^>]*href=["\']([^"\']*)["\'][^>]*>([^<]*)</a>',
-                  r'\2 (\1)', text, flags=re.IGNORECASE)
+    text = _RE_LINK.sub(r'\2 (\1)', text)
 
     # Convert headers to text with emphasis
-    text = re.sub(r'<h[1-6][^>]*>([^<]*)</h[1-6]>', r'\n\1\n' + '=' * 40 + '\n', text, flags=re.IGNORECASE)
-
-    # Convert paragraphs and divs to newlines
-    text = re.sub(r'<(?:p|div)[^>]*>', '\n', text, flags=re.IGNORECASE)
-    text = re.sub(r'</(?:p|div)>', '\n', text, flags=re.IGNORECASE)
+    text = _RE_HEADER.sub(r'\n\1\n' + '=' * 40 + '\n', text)
 
-    # Convert line breaks
-    text = re.sub(r'<br\s*/?>', '\n', text, flags=re.IGNORECASE)
+    # Convert paragraphs, divs and line breaks to newlines
+    text = _RE_BLOCK.sub('\n', text)
 
     # Convert list items
-    text = re.sub(r'<li[^>]*>', '\n- ', text, flags=re.IGNORECASE)
+    text = _RE_LIST_ITEM.sub('\n- ', text)
 
     # Remove all remaining HTML tags
-    text = re.sub(r'<[^>]+>', '', text)
-
-    # Decode common HTML entities
-    text = text.replace('&nbsp;', ' ')
-    text = text.replace('&amp;', '&')
-    text = text.replace('&lt;', '<')
-    text = text.replace('&gt;', '>')
-    text = text.replace('&quot;', '"')
-    text = text.replace('&#39;', "'")
-    text = text.replace('&mdash;', '-')
-    text = text.replace('&ndash;', '-')
+    text = _RE_TAG.sub('', text)
+
+    # Decode common HTML entities. One pass, so an escaped entity such as
+    # &amp;lt; comes out as the literal text &lt;
+    text = _RE_ENTITY.sub(lambda m: _ENTITIES[m.group(1)], text)
 
     # Clean up whitespace
-    text = re.sub(r'[ \t]+', ' ', text)  # Multiple spaces to single
-    text = re.sub(r'\n\s*\n\s*\n+', '\n\n', text)  # Multiple newlines to double
+    text = _RE_SPACES.sub(' ', text)  # Multiple spaces to single
+    text = _RE_BLANK_LINES.sub('\n\n', text)  # Multiple newlines to double
     text = text.strip()
 
     return text
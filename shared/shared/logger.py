@@ -17,65 +17,60 @@ import sys
 from contextvars import ContextVar
 from typing import Any, Dict, Optional
 
-from pythonjsonlogger import jsonlogger
+import orjson
 
 from shared.config import get_settings
 
-# Context variables for correlation IDs
-request_id_var: ContextVar[Optional[str]] = ContextVar("request_id", default=None)
-image_id_var: ContextVar[Optional[str]] = ContextVar("image_id", default=None)
-user_id_var: ContextVar[Optional[str]] = ContextVar("user_id", default=None)
+# Correlation IDs (request_id, image_id, user_id) for the current task, kept in
+# one context variable so the formatter reads them with a single get(). The
+# dict is replaced on every change, never mutated.
+_correlation_var: ContextVar[Dict[str, str]] = ContextVar("correlation", default={})
 
 
-class ContextInjectorFilter(logging.Filter):
-    """Injects correlation IDs from context into log records."""
+# Attributes every LogRecord has. Anything else on a record came in through
+# `extra` (the StructuredLogger kwargs).
+_RECORD_ATTRS = frozenset(vars(logging.LogRecord("", 0, "", 0, "", None, None))) | {"message", "asctime"}
 
-    def filter(self, record: logging.LogRecord) -> bool:
-        # Inject request_id if present in context
-        request_id = request_id_var.get()
-        if request_id:
-            record.request_id = request_id  # type: ignore
+_ORJSON_OPTIONS = orjson.OPT_NAIVE_UTC | orjson.OPT_UTC_Z | orjson.OPT_NON_STR_KEYS
 
-        # Inject image_id if present in context
-        image_id = image_id_var.get()
-        if image_id:
-            record.image_id = image_id  # type: ignore
 
-        # Inject user_id if present in context
-        user_id = user_id_var.get()
-        if user_id:
-            record.user_id = user_id  # type: ignore
+class CustomJsonFormatter(logging.Formatter):
+    """JSON formatter with consistent field names, encoded with orjson."""
 
-        return True
+    def __init__(self, static_fields: Optional[Dict[str, Any]] = None) -> None:
+        super().__init__()
+        self.static_fields = static_fields or {}
+        # The static fields never change, so encode them once as the opening
+        # of every record: '{"service":"api",' instead of '{'.
+        if self.static_fields:
+            self._prefix = orjson.dumps(self.static_fields, default=str, option=_ORJSON_OPTIONS)[:-1] + b","
+        else:
+            self._prefix = b"{"
 
+    def format(self, record: logging.LogRecord) -> str:
+        log_record: Dict[str, Any] = {
+            "timestamp": self.formatTime(record, self.datefmt),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+        }
 
-class CustomJsonFormatter(jsonlogger.JsonFormatter):
-    """Custom JSON formatter with consistent field names."""
+        # Extra fields
+        for key, value in record.__dict__.items():
+            if key not in _RECORD_ATTRS and key not in self.static_fields and not key.startswith("_"):
+                log_record[key] = value
 
-    def add_fields(
-        self,
-        log_record: Dict[str, Any],
-        record: logging.LogRecord,
-        message_dict: Dict[str, Any],
-    ) -> None:
-        super().add_fields(log_record, record, message_dict)
-
-        # Add standard fields
-        log_record["timestamp"] = self.formatTime(record, self.datefmt)
-        log_record["level"] = record.levelname
-        log_record["logger"] = record.name
-
-        # Add correlation IDs if present
-        if hasattr(record, "request_id"):
-            log_record["request_id"] = record.request_id
-        if hasattr(record, "image_id"):
-            log_record["image_id"] = record.image_id
-        if hasattr(record, "user_id"):
-            log_record["user_id"] = record.user_id
+        # Correlation IDs, read from context when the record is formatted
+        log_record.update(_correlation_var.get())
 
         # Add exception info if present
         if record.exc_info:
             log_record["exc_info"] = self.formatException(record.exc_info)
+        if record.stack_info:
+            log_record["stack_info"] = self.formatStack(record.stack_info)
+
+        encoded = orjson.dumps(log_record, default=str, option=_ORJSON_OPTIONS)
+        return (self._prefix + encoded[1:]).decode()
 
 
 class StructuredLogger:
@@ -94,6 +89,9 @@ class StructuredLogger:
 
     def _log(self, level: int, msg: str, *args: Any, **kwargs: Any) -> None:
         """Internal log method that handles kwargs."""
+        if not self._logger.isEnabledFor(level):
+            return
+
         # Separate exc_info from other kwargs
         exc_info = kwargs.pop("exc_info", False)
 
@@ -156,18 +154,10 @@ def get_logger(service_name: str) -> StructuredLogger:
     handler = logging.StreamHandler(sys.stdout)
     handler.setLevel(log_level)
 
-    # Add context injector filter
-    context_filter = ContextInjectorFilter()
-    handler.addFilter(context_filter)
-
     # Set formatter based on LOG_FORMAT setting
     if settings.log_format.lower() == "json":
         # JSON formatter for production
-        formatter = CustomJsonFormatter(
-            "%(timestamp)s %(level)s %(logger)s %(message)s",
-            rename_fields={"logger": "service"},
-            static_fields={"service": service_name},
-        )
+        formatter = CustomJsonFormatter(static_fields={"service": service_name})
     else:
         # Human-readable formatter for development
         formatter = logging.Formatter(
@@ -184,6 +174,14 @@ def get_logger(service_name: str) -> StructuredLogger:
     return StructuredLogger(logger)
 
 
+def _set_correlation_id(field: str, value: Optional[str]) -> None:
+    """Set or clear one correlation ID, copying the dict so other tasks keep theirs."""
+    ids = {k: v for k, v in _correlation_var.get().items() if k != field}
+    if value:
+        ids[field] = value
+    _correlation_var.set(ids)
+
+
 def set_request_id(request_id: str) -> None:
     """
     Set request_id in context for current async task.
@@ -194,7 +192,7 @@ def set_request_id(request_id: str) -> None:
     Example:
         >>> set_request_id("550e8400-e29b-41d4-a716-446655440000")
     """
-    request_id_var.set(request_id)
+    _set_correlation_id("request_id", request_id)
 
 
 def set_image_id(image_id: str) -> None:
@@ -207,7 +205,7 @@ def set_image_id(image_id: str) -> None:
     Example:
         >>> set_image_id("img-abc-123")
     """
-    image_id_var.set(image_id)
+    _set_correlation_id("image_id", image_id)
 
 
 def set_user_id(user_id: str) -> None:
@@ -220,7 +218,7 @@ def set_user_id(user_id: str) -> None:
     Example:
         >>> set_user_id("user-456")
     """
-    user_id_var.set(user_id)
+    _set_correlation_id("user_id", user_id)
 
 
 def clear_context() -> None:
@@ -230,6 +228,4 @@ def clear_context() -> None:
     Useful at the end of request processing to avoid leaking IDs
     between requests in async environments.
     """
-    request_id_var.set(None)
-    image_id_var.set(None)
-    user_id_var.set(None)
+    _correlation_var.set({})
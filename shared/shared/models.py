@@ -4,7 +4,8 @@ SQLAlchemy database models
 Defines the database schema for all tables.
 All services import models from this file to ensure consistency.
 """
-from sqlalchemy import Column, Integer, String, Float, DateTime, Date, ForeignKey, Boolean, JSON, Text, UniqueConstraint
+from sqlalchemy import Column, Integer, String, Float, DateTime, Date, ForeignKey, Boolean, JSON, Text, UniqueConstraint, Index
+from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 from geoalchemy2 import Geography
@@ -20,7 +21,8 @@ class Image(Base):
     id = Column(Integer, primary_key=True, index=True)
     uuid = Column(String(36), unique=True, nullable=False, index=True)
     filename = Column(String(255), nullable=False)
-    camera_id = Column(Integer, ForeignKey("cameras.id"), nullable=False, index=True)
+    # Indexed as the leading column of ix_images_camera_id_captured_at_cover
+    camera_id = Column(Integer, ForeignKey("cameras.id"), nullable=False)
     # Camera wall-clock reading at capture, stored naive. Interpret under ServerSettings.timezone.
     captured_at = Column(DateTime(timezone=False), nullable=False, index=True)
     storage_path = Column(String(512), nullable=False)
@@ -94,12 +96,20 @@ class Image(Base):
 
     # Relationships
     camera = relationship("Camera", back_populates="images")
-    detections = relationship("Detection", back_populates="image", cascade="all, delete-orphan")
+    detections = relationship("Detection", back_populates="image", cascade="all, delete-orphan", passive_deletes=True)
     human_observations = relationship("HumanObservation", back_populates="image", cascade="all, delete-orphan")
     verified_by = relationship("User", foreign_keys=[verified_by_user_id])
     liked_by = relationship("User", foreign_keys=[liked_by_user_id])
     needs_review_by = relationship("User", foreign_keys=[needs_review_by_user_id])
 
+    __table_args__ = (
+        Index(
+            'ix_images_camera_id_captured_at_cover',
+            'camera_id', 'captured_at',
+            postgresql_include=['id', 'is_verified'],
+        ),
+    )
+
 
 class Camera(Base):
     """Camera trap device"""
@@ -289,14 +299,23 @@ class Detection(Base):
     __tablename__ = "detections"
 
     id = Column(Integer, primary_key=True, index=True)
-    image_id = Column(Integer, ForeignKey("images.id"), nullable=False, index=True)
+    # Indexed as the leading column of ix_detections_image_id_confidence_cover
+    image_id = Column(Integer, ForeignKey("images.id", ondelete="CASCADE"), nullable=False)
     category = Column(String(50), nullable=True, index=True)  # animal, person, vehicle
     bbox = Column(JSON, nullable=False)  # {x, y, width, height}
     confidence = Column(Float, nullable=False)
 
     # Relationships
     image = relationship("Image", back_populates="detections")
-    classifications = relationship("Classification", back_populates="detection", cascade="all, delete-orphan")
+    classifications = relationship("Classification", back_populates="detection", cascade="all, delete-orphan", passive_deletes=True)
+
+    __table_args__ = (
+        Index(
+            'ix_detections_image_id_confidence_cover',
+            'image_id', 'confidence',
+            postgresql_include=['id', 'category'],
+        ),
+    )
 
 
 class Classification(Base):
@@ -304,7 +323,8 @@ class Classification(Base):
     __tablename__ = "classifications"
 
     id = Column(Integer, primary_key=True, index=True)
-    detection_id = Column(Integer, ForeignKey("detections.id"), nullable=False, index=True)
+    # Indexed as the leading column of ix_classifications_detection_species_conf
+    detection_id = Column(Integer, ForeignKey("detections.id", ondelete="CASCADE"), nullable=False)
     species = Column(String(255), nullable=False, index=True)  # Top-1 species
     confidence = Column(Float, nullable=False)  # Top-1 confidence
     raw_prediction = Column(String(512), nullable=True)  # Full SpeciesNet label (semicolon-delimited)
@@ -313,6 +333,10 @@ class Classification(Base):
     # Relationships
     detection = relationship("Detection", back_populates="classifications")
 
+    __table_args__ = (
+        Index('ix_classifications_detection_species_conf', 'detection_id', 'species', 'confidence'),
+    )
+
 
 class HumanObservation(Base):
     """Human-entered species observation for an image (image-level, not detection-level)"""
@@ -469,7 +493,7 @@ class ProjectNotificationPreference(Base):
     notify_low_battery = Column(Boolean, nullable=False, server_default="true")  # DEPRECATED: Use notification_channels instead
     battery_threshold = Column(Integer, nullable=False, server_default="30")  # DEPRECATED: Use notification_channels instead
     notify_system_health = Column(Boolean, nullable=False, server_default="false")  # DEPRECATED: Use notification_channels instead
-    notification_channels = Column(JSON, nullable=True)  # Per-notification-type channel configuration
+    notification_channels = Column(JSONB, nullable=True)  # Per-notification-type channel configuration
     created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
     updated_at = Column(DateTime(timezone=True), onupdate=func.now(), nullable=True)
 
@@ -492,7 +516,17 @@ class NotificationLog(Base):
     message_content = Column(Text, nullable=False)
     error_message = Column(Text, nullable=True)
     sent_at = Column(DateTime(timezone=True), nullable=True)
-    created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False, index=True)
+    # BRIN index ix_notification_logs_created_at_brin
+    created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
+
+    __table_args__ = (
+        Index(
+            'ix_notification_logs_created_at_brin',
+            'created_at',
+            postgresql_using='brin',
+            postgresql_with={'pages_per_range': 32},
+        ),
+    )
 
 
 class ProjectReminder(Base):
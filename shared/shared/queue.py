@@ -3,9 +3,12 @@ Redis queue client wrapper
 
 Provides simple interface for pub/sub messaging between services.
 """
+import orjson
+import random
 import redis
-import json
+import socket
 import time
+from datetime import datetime, timezone
 from typing import Any, Optional, Callable
 from .config import get_settings
 from .logger import get_logger
@@ -13,17 +16,64 @@ from .logger import get_logger
 settings = get_settings()
 logger = get_logger("queue")
 
+# One client, and so one connection pool, per process. Handlers create a
+# RedisQueue per event, and each from_url call would open a new pool and
+# TCP connection. The pool is thread-safe and hands a blocking BRPOP its
+# own connection, so sharing it does not stall publishers.
+_client: Optional[redis.Redis] = None
+
+# Reconnect backoff doubles with each consecutive Redis failure up to this cap
+RECONNECT_MAX_SECONDS = 30
+
+# Newest entries kept on the failed-jobs queue; older ones are dropped so
+# a handler that fails on every message cannot fill Redis memory.
+FAILED_JOBS_MAX_LENGTH = 10000
+
+# TCP keepalive timing: probe after 60s idle, every 10s, give up after 3.
+# The option names are Linux-only (macOS lacks some), so only the ones
+# this platform has are set; the rest keep their OS defaults.
+_KEEPALIVE_OPTIONS = {
+    getattr(socket, name): value
+    for name, value in (("TCP_KEEPIDLE", 60), ("TCP_KEEPINTVL", 10), ("TCP_KEEPCNT", 3))
+    if hasattr(socket, name)
+}
+
+
+def _get_client() -> redis.Redis:
+    global _client
+    if _client is None:
+        # No socket_timeout: consumers block on BRPOP indefinitely, and a read
+        # timeout would break every idle wait. TCP keepalive instead notices a
+        # peer that vanished without closing (about 90s), so the BRPOP raises
+        # and the consumer reconnects rather than hanging. health_check_interval
+        # pings a connection idle for 30s before reusing it. redis-py already
+        # sets TCP_NODELAY.
+        _client = redis.from_url(
+            settings.redis_url,
+            decode_responses=True,
+            socket_keepalive=True,
+            socket_keepalive_options=_KEEPALIVE_OPTIONS,
+            health_check_interval=30,
+        )
+    return _client
+
+
+def _dumps(message: dict) -> bytes:
+    """Encode a message as JSON; int dict keys become strings like json.dumps."""
+    return orjson.dumps(message, option=orjson.OPT_NON_STR_KEYS)
+
 
 class RedisQueue:
     """
     Redis-based message queue.
 
     Uses Redis lists for FIFO queue with BRPOP for blocking consumption.
+    Messages are JSON text, encoded and decoded with orjson.
     """
 
     def __init__(self, queue_name: str):
         self.queue_name = queue_name
-        self.client = redis.from_url(settings.redis_url, decode_responses=True)
+        self.client = _get_client()
 
     def publish(self, message: dict) -> None:
         """
@@ -32,7 +82,20 @@ class RedisQueue:
         Args:
             message: Dictionary to serialize as JSON
         """
-        self.client.lpush(self.queue_name, json.dumps(message))
+        self.client.lpush(self.queue_name, _dumps(message))
+
+    def publish_many(self, messages: list[dict]) -> None:
+        """
+        Publish several messages to queue in one round trip.
+
+        Consumers receive them in list order, same as calling publish()
+        for each one.
+
+        Args:
+            messages: Dictionaries to serialize as JSON
+        """
+        if messages:
+            self.client.lpush(self.queue_name, *(_dumps(message) for message in messages))
 
     def consume(self, timeout: int = 0) -> Optional[dict]:
         """
@@ -47,24 +110,77 @@ class RedisQueue:
         result = self.client.brpop(self.queue_name, timeout=timeout)
         if result:
             _, message = result
-            return json.loads(message)
+            return orjson.loads(message)
         return None
 
-    def _reconnect(self, backoff_seconds: float = 1.0) -> None:
+    def consume_batch(self, max_messages: int, timeout: int = 0) -> list[dict]:
         """
-        Recreate the Redis client after a connection or read error.
+        Consume up to max_messages from queue (blocking for the first one).
+
+        Blocks on BLMPOP (Redis 7) until at least one message arrives and
+        takes up to max_messages of those waiting in the same round trip.
+        Never waits to fill the batch, so a lone message is handled as
+        fast as consume().
+
+        Args:
+            max_messages: Largest batch to return
+            timeout: Timeout in seconds for the first message (0 = wait indefinitely)
+
+        Returns:
+            Deserialized messages in queue order, empty list on timeout
+        """
+        # RIGHT pops from the tail, where the oldest message sits
+        result = self.client.blmpop(
+            timeout, 1, self.queue_name, direction="RIGHT", count=max_messages
+        )
+        if not result:
+            return []
+        _, raw_messages = result
+        return [orjson.loads(raw) for raw in raw_messages]
+
+    def _reconnect(self, failures: int = 1) -> None:
+        """
+        Drop pooled Redis connections after a connection or read error.
 
         A long-running consumer must survive a transient Redis blip (dropped
         connection, socket read timeout) instead of letting the exception
-        crash the worker. Sleeps briefly first so a persistent failure does
-        not become a tight reconnect loop.
+        crash the worker. Sleeps first, 1s after the first failure and
+        doubling up to RECONNECT_MAX_SECONDS, with jitter so a fleet of
+        workers does not reconnect in lockstep. The client is shared, so
+        only idle sockets are dropped; the next command opens a fresh one.
+
+        Args:
+            failures: Consecutive failures so far, including this one
         """
-        time.sleep(backoff_seconds)
+        backoff = min(RECONNECT_MAX_SECONDS, 2 ** (failures - 1))
+        time.sleep(backoff + random.uniform(0, 0.5))
         try:
-            self.client.close()
+            self.client.connection_pool.disconnect(inuse_connections=False)
         except Exception:
             pass
-        self.client = redis.from_url(settings.redis_url, decode_responses=True)
+
+    def _dead_letter(self, message: Any, source_queue: str, error: Exception) -> None:
+        """
+        Push a message whose callback raised onto the failed-jobs queue.
+
+        The entry keeps the source queue and error so it can be inspected
+        and replayed by hand. A Redis error here is logged, not raised, so
+        the consumer loop keeps running.
+        """
+        try:
+            self.client.lpush(QUEUE_FAILED_JOBS, _dumps({
+                "queue": source_queue,
+                "error": str(error),
+                "failed_at": datetime.now(timezone.utc).isoformat(),
+                "message": message,
+            }))
+            self.client.ltrim(QUEUE_FAILED_JOBS, 0, FAILED_JOBS_MAX_LENGTH - 1)
+        except redis.RedisError as e:
+            logger.error(
+                "Failed to dead-letter message",
+                queue=source_queue,
+                error=str(e),
+            )
 
     def consume_forever(self, callback: Callable[[dict], None]) -> None:
         """
@@ -74,17 +190,21 @@ class RedisQueue:
             callback: Function to call with each message
         """
         logger.info("Worker listening on queue", queue=self.queue_name)
+        failures = 0
         while True:
             try:
                 message = self.consume()
             except (redis.ConnectionError, redis.TimeoutError) as e:
+                failures += 1
                 logger.warning(
                     "Redis read failed, reconnecting",
                     queue=self.queue_name,
                     error=str(e),
+                    failures=failures,
                 )
-                self._reconnect()
+                self._reconnect(failures)
                 continue
+            failures = 0
             if message:
                 try:
                     callback(message)
@@ -95,7 +215,66 @@ class RedisQueue:
                         error=str(e),
                         exc_info=True,
                     )
-                    # TODO: Add to dead-letter queue
+                    self._dead_letter(message, self.queue_name, e)
+
+    def consume_forever_batch(
+        self,
+        callback: Callable[[list[dict], Callable[[dict, Exception], None]], None],
+        max_messages: int = 64,
+    ) -> None:
+        """
+        Consume messages in infinite loop, handing them over in batches.
+
+        Lets a consumer resolve a burst of messages together (for example
+        with one database query) instead of one round trip per message.
+
+        The callback also gets a dead_letter(message, error) function and
+        must call it for each message that fails, at the point it fails.
+        If the callback raises, every message of the batch it has not
+        dead-lettered itself goes to failed-jobs too, so nothing popped is
+        lost. Some of those may already have been handled, so check before
+        replaying them.
+
+        Args:
+            callback: Function to call with each batch and dead_letter
+            max_messages: Largest batch passed to callback
+        """
+        logger.info("Worker listening on queue", queue=self.queue_name, batch_size=max_messages)
+        failures = 0
+        while True:
+            try:
+                messages = self.consume_batch(max_messages)
+            except (redis.ConnectionError, redis.TimeoutError) as e:
+                failures += 1
+                logger.warning(
+                    "Redis read failed, reconnecting",
+                    queue=self.queue_name,
+                    error=str(e),
+                    failures=failures,
+                )
+                self._reconnect(failures)
+                continue
+            failures = 0
+            if messages:
+                dead_lettered: set[int] = set()
+
+                def dead_letter(message: dict, error: Exception) -> None:
+                    dead_lettered.add(id(message))
+                    self._dead_letter(message, self.queue_name, error)
+
+                try:
+                    callback(messages, dead_letter)
+                except Exception as e:
+                    logger.error(
+                        "Error processing message batch",
+                        queue=self.queue_name,
+                        batch_size=len(messages),
+                        error=str(e),
+                        exc_info=True,
+                    )
+                    for message in messages:
+                        if id(message) not in dead_lettered:
+                            self._dead_letter(message, self.queue_name, e)
 
     def consume_forever_priority(
         self,
@@ -117,22 +296,27 @@ class RedisQueue:
             callback: Function called with the message dict.
         """
         logger.info("Worker listening on priority queues", queues=queues)
+        failures = 0
         while True:
             try:
                 result = self.client.brpop(queues, timeout=0)
             except (redis.ConnectionError, redis.TimeoutError) as e:
+                failures += 1
                 logger.warning(
                     "Redis read failed, reconnecting",
                     queues=queues,
                     error=str(e),
+                    failures=failures,
                 )
-                self._reconnect()
+                self._reconnect(failures)
                 continue
+            failures = 0
             if not result:
                 continue
             source_queue, raw = result
+            message = None
             try:
-                message = json.loads(raw)
+                message = orjson.loads(raw)
                 callback(message)
             except Exception as e:
                 logger.error(
@@ -141,6 +325,8 @@ class RedisQueue:
                     error=str(e),
                     exc_info=True,
                 )
+                # Undecodable payloads are kept as the raw text
+                self._dead_letter(raw if message is None else message, source_queue, e)
 
     def queue_depth(self) -> int:
         """Get current queue depth"""
@@ -12,16 +12,16 @@ from .config import get_settings
 
 settings = get_settings()
 
+# One boto3 client per process. Building one loads the S3 service model
+# and endpoint rules, and routes create a StorageClient per request. boto3
+# clients are thread-safe, so sharing it is fine.
+_client = None
 
-class StorageClient:
-    """
-    MinIO/S3 client wrapper.
-
-    Provides methods for uploading, downloading, and managing objects.
-    """
 
-    def __init__(self):
-        self.client = boto3.client(
+def _get_client():
+    global _client
+    if _client is None:
+        _client = boto3.client(
             's3',
             endpoint_url=f"http://{settings.minio_endpoint}",
             aws_access_key_id=settings.minio_access_key,
@@ -29,6 +29,18 @@ class StorageClient:
             config=Config(signature_version='s3v4', s3={'addressing_style': 'path'}),
             region_name='us-east-1'
         )
+    return _client
+
+
+class StorageClient:
+    """
+    MinIO/S3 client wrapper.
+
+    Provides methods for uploading, downloading, and managing objects.
+    """
+
+    def __init__(self):
+        self.client = _get_client()
 
     def upload_file(self, file_path: str, bucket: str, object_name: Optional[str] = None) -> str:
         """
@@ -63,6 +75,35 @@ class StorageClient:
         self.client.upload_fileobj(file_obj, bucket, object_name)
         return object_name
 
+    def put_bytes(
+        self,
+        data: bytes,
+        bucket: str,
+        object_name: str,
+        content_type: Optional[str] = None,
+    ) -> str:
+        """
+        Upload bytes already in memory to MinIO with a single PUT.
+
+        Skips the transfer manager (and its thread pool) that
+        upload_fileobj sets up on every call, which is pure overhead for
+        thumbnails, annotated images and other small in-memory objects.
+
+        Args:
+            data: Object contents
+            bucket: Bucket name
+            object_name: Object name in bucket
+            content_type: MIME type to store (optional)
+
+        Returns:
+            Object name in bucket
+        """
+        kwargs = {'Bucket': bucket, 'Key': object_name, 'Body': data}
+        if content_type:
+            kwargs['ContentType'] = content_type
+        self.client.put_object(**kwargs)
+        return object_name
+
     def download_file(self, bucket: str, object_name: str, file_path: str) -> None:
         """
         Download file from MinIO.
@@ -114,6 +155,37 @@ class StorageClient:
         """
         self.client.delete_object(Bucket=bucket, Key=object_name)
 
+    def delete_objects(self, bucket: str, object_names: list[str]) -> int:
+        """
+        Delete many objects from MinIO, up to 1000 per request.
+
+        Args:
+            bucket: Bucket name
+            object_names: Object names
+
+        Returns:
+            Number of objects deleted
+
+        Raises:
+            RuntimeError: If MinIO reports any object it could not delete
+        """
+        deleted = 0
+        for start in range(0, len(object_names), 1000):
+            batch = object_names[start:start + 1000]
+            response = self.client.delete_objects(
+                Bucket=bucket,
+                Delete={'Objects': [{'Key': name} for name in batch], 'Quiet': True},
+            )
+            # Quiet mode only reports failures
+            errors = response.get('Errors', [])
+            if errors:
+                raise RuntimeError(
+                    f"Failed to delete {len(errors)} objects from {bucket}, "
+                    f"first: {errors[0].get('Key')} ({errors[0].get('Message')})"
+                )
+            deleted += len(batch)
+        return deleted
+
     def list_objects(self, bucket: str, prefix: Optional[str] = None) -> list[str]:
         """
         List objects in bucket.
@@ -129,11 +201,13 @@ class StorageClient:
         if prefix:
             kwargs['Prefix'] = prefix
 
-        response = self.client.list_objects_v2(**kwargs)
-        if 'Contents' not in response:
-            return []
-
-        return [obj['Key'] for obj in response['Contents']]
+        # One list_objects_v2 call returns at most 1000 keys
+        paginator = self.client.get_paginator('list_objects_v2')
+        return [
+            obj['Key']
+            for page in paginator.paginate(**kwargs)
+            for obj in page.get('Contents', [])
+        ]
 
 
 # Bucket names (constants)
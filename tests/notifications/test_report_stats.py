@@ -0,0 +1,165 @@
+"""Tests for the email report statistics queries.
+
+The helpers run against a compile-asserting fake session: each query is
+compiled against the postgres dialect and canned rows are returned, so the
+Python post-processing is exercised without a database.
+"""
+from datetime import date
+from decimal import Decimal
+from types import SimpleNamespace
+
+from sqlalchemy.dialects import postgresql
+
+from report_stats import (
+    get_camera_health_summary,
+    get_notable_detections,
+    get_overview_stats,
+    get_species_and_activity,
+)
+
+
+class _FakeResult:
+    def __init__(self, rows):
+        self._rows = rows
+
+    def all(self):
+        return self._rows
+
+    def one(self):
+        assert len(self._rows) == 1
+        return self._rows[0]
+
+    def scalar_one(self):
+        return self.one()
+
+
+class _CompileAssertingSession:
+    """Compiles each query against the postgres dialect and replays rows."""
+
+    def __init__(self, rows=None) -> None:
+        self._rows = rows or []
+        self.compiled_queries: list[str] = []
+
+    def execute(self, query, params=None):
+        compiled = query.compile(dialect=postgresql.dialect())
+        self.compiled_queries.append(str(compiled))
+        return _FakeResult(self._rows)
+
+
+def _species_row(species, count):
+    return SimpleNamespace(species=species, hour=None, is_hour_row=0, total_count=count, peak_hour=None)
+
+
+def _hour_row(hour, count, peak_hour):
+    return SimpleNamespace(species=None, hour=hour, is_hour_row=1, total_count=count, peak_hour=peak_hour)
+
+
+class TestOverviewStats:
+    def test_species_counted_in_sql(self):
+        row = SimpleNamespace(total_species=4, new_species=1)
+        db = _CompileAssertingSession([row])
+        # The fake returns the same row for the scalar counts too
+        overview = get_overview_stats(db, 1, date(2026, 1, 1), date(2026, 1, 7), detection_threshold=0.5)
+        assert len(db.compiled_queries) == 4
+        assert "count(*) FILTER (WHERE" in db.compiled_queries[-1]
+        assert overview["total_species"] == 4
+        assert overview["new_species"] == 1
+
+
+class TestSpeciesAndActivity:
+    def test_single_grouping_sets_query(self):
+        db = _CompileAssertingSession()
+        get_species_and_activity(db, 1, date(2026, 1, 1), date(2026, 1, 7), detection_threshold=0.5)
+        assert len(db.compiled_queries) == 1
+        assert "GROUPING SETS" in db.compiled_queries[0]
+        assert "first_value(" in db.compiled_queries[0]
+
+    def test_rows_split_by_grouping_marker(self):
+        db = _CompileAssertingSession([
+            _species_row("fox", 5),
+            _species_row("deer", 9),
+            _hour_row(3, 10, Decimal(3)),
+            _hour_row(22, 4, Decimal(3)),
+        ])
+        species, activity = get_species_and_activity(
+            db, 1, date(2026, 1, 1), date(2026, 1, 7), detection_threshold=0.5
+        )
+        assert species == [{"species": "deer", "count": 9}, {"species": "fox", "count": 5}]
+        assert activity["total_detections"] == 14
+        assert activity["peak_hour"] == 3
+        assert activity["hourly_distribution"][22] == 4
+
+    def test_species_limit(self):
+        db = _CompileAssertingSession([_species_row(f"sp{i}", i) for i in range(1, 8)])
+        species, _ = get_species_and_activity(
+            db, 1, date(2026, 1, 1), date(2026, 1, 7), limit=3, detection_threshold=0.5
+        )
+        assert [s["species"] for s in species] == ["sp7", "sp6", "sp5"]
+
+    def test_empty_period_has_no_peak(self):
+        db = _CompileAssertingSession()
+        species, activity = get_species_and_activity(
+            db, 1, date(2026, 1, 1), date(2026, 1, 7), detection_threshold=0.5
+        )
+        assert species == []
+        assert activity == {
+            "total_detections": 0,
+            "peak_hour": None,
+            "hourly_distribution": [0] * 24,
+        }
+
+
+class TestCameraHealthSummary:
+    def test_single_aggregate_query(self):
+        db = _CompileAssertingSession([SimpleNamespace(
+            total=0, active=0, inactive_cameras=None, never_reported_cameras=None,
+            low_battery_cameras=None, high_sd_cameras=None, avg_battery=None, avg_sd=None,
+        )])
+        get_camera_health_summary(db, 1)
+        assert len(db.compiled_queries) == 1
+        assert "FILTER (WHERE" in db.compiled_queries[0]
+
+    def test_null_aggregates_become_empty(self):
+        db = _CompileAssertingSession([SimpleNamespace(
+            total=0, active=0, inactive_cameras=None, never_reported_cameras=None,
+            low_battery_cameras=None, high_sd_cameras=None, avg_battery=None, avg_sd=None,
+        )])
+        summary = get_camera_health_summary(db, 1)
+        assert summary["inactive_cameras"] == []
+        assert summary["low_battery_count"] == 0
+        assert summary["avg_battery"] == 0
+
+    def test_aggregates_passed_through(self):
+        db = _CompileAssertingSession([SimpleNamespace(
+            total=3, active=1,
+            inactive_cameras=[{"name": "CAM2"}],
+            never_reported_cameras=[{"name": "CAM3"}],
+            low_battery_cameras=[{"name": "CAM2", "battery": 12}],
+            high_sd_cameras=[{"name": "CAM1", "sd_percent": 91}],
+            avg_battery=Decimal("47.5"), avg_sd=Decimal("60.9"),
+        )])
+        summary = get_camera_health_summary(db, 1)
+        assert summary["inactive"] == 1
+        assert summary["never_reported"] == 1
+        assert summary["low_battery_cameras"] == [{"name": "CAM2", "battery": 12}]
+        assert summary["high_sd_count"] == 1
+        assert summary["avg_battery"] == 47
+        assert summary["avg_sd"] == 60
+
+
+class TestNotableDetections:
+    def test_global_top_n_by_default(self):
+        db = _CompileAssertingSession()
+        get_notable_detections(db, 1, date(2026, 1, 1), date(2026, 1, 7), detection_threshold=0.5)
+        assert "row_number()" not in db.compiled_queries[0]
+        assert "ORDER BY classifications.confidence DESC" in db.compiled_queries[0]
+
+    def test_per_camera_limit_uses_window(self):
+        db = _CompileAssertingSession()
+        get_notable_detections(
+            db, 1, date(2026, 1, 1), date(2026, 1, 7),
+            detection_threshold=0.5, per_camera_limit=2,
+        )
+        sql = db.compiled_queries[0]
+        assert "row_number() OVER (PARTITION BY cameras.id ORDER BY classifications.confidence DESC)" in sql
+        assert "camera_rank <=" in sql
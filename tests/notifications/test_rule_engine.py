@@ -159,3 +159,50 @@ class TestSiteScope:
 
     def test_missing_site_passes_when_unscoped(self):
         assert check_site_scope(None, None) is False
+
+
+# ---------------------------------------------------------------------------
+# rule_engine.prefetch_matching_users: the batched lookup must give each pair
+# the same preference rows as the per-event lookup.
+# ---------------------------------------------------------------------------
+
+class _FakeResult:
+    def __init__(self, rows):
+        self.rows = rows
+
+    def all(self):
+        return self.rows
+
+    def scalars(self):
+        return self
+
+
+def test_prefetch_keeps_one_row_per_species_despite_duplicates(monkeypatch):
+    from types import SimpleNamespace
+
+    import rule_engine
+
+    pref = SimpleNamespace(
+        project_id=1,
+        notification_channels={
+            'species_detection': {'notify_species': ['wolf', 'wolf', 7, 'fox']},
+        },
+    )
+    results = {
+        id(rule_engine._SUBSCRIBED_PROJECTS_STMT): [1],
+        id(rule_engine._PROJECTS_BATCH_STMT): [SimpleNamespace(id=1)],
+        id(rule_engine._SPECIES_BATCH_STMT): [pref],
+    }
+    session = SimpleNamespace(execute=lambda stmt, params=None: _FakeResult(results[id(stmt)]))
+    monkeypatch.setattr(rule_engine, '_candidates_cache', {})
+    monkeypatch.setattr(rule_engine, '_subscribed_projects', (0.0, frozenset()))
+
+    events = [
+        {'event_type': 'species_detection', 'project_id': 1, 'species': 'wolf'},
+        {'event_type': 'species_detection', 'project_id': 1, 'species': 'fox'},
+    ]
+    rule_engine.prefetch_matching_users(events, session)
+
+    cache = rule_engine._candidates_cache
+    assert cache[(1, 'species_detection', 'wolf')][1][1] == [pref]
+    assert cache[(1, 'species_detection', 'fox')][1][1] == [pref]
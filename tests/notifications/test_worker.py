@@ -0,0 +1,87 @@
+"""Tests for dead-lettering in the notifications batch consumer."""
+import json
+
+import pytest
+
+import worker
+from shared.queue import QUEUE_FAILED_JOBS, RedisQueue
+
+
+class _Stop(BaseException):
+    """Ends consume_forever_batch after the first batch."""
+
+
+class _FakeRedis:
+    """Serves one batch, then stops the loop; records dead-lettered entries."""
+
+    def __init__(self, messages):
+        self.batches = [[json.dumps(m) for m in messages]]
+        self.failed = []
+
+    def blmpop(self, timeout, numkeys, name, direction, count=1):
+        if not self.batches:
+            raise _Stop()
+        return [name, self.batches.pop()]
+
+    def lpush(self, name, *values):
+        assert name == QUEUE_FAILED_JOBS
+        self.failed.extend(json.loads(value) for value in values)
+
+    def ltrim(self, name, start, end):
+        pass
+
+
+def _run_batch(monkeypatch, events):
+    def fake_process(event):
+        if event.get("bad"):
+            raise ValueError("bad event")
+
+    monkeypatch.setattr(worker, "prefetch_matching_users", lambda events: None)
+    monkeypatch.setattr(worker, "process_notification_event", fake_process)
+
+    queue = RedisQueue("notification-events")
+    queue.client = _FakeRedis(events)
+    with pytest.raises(_Stop):
+        queue.consume_forever_batch(worker.process_notification_batch)
+    return queue.client.failed
+
+
+def test_only_the_failing_event_is_dead_lettered(monkeypatch):
+    failed = _run_batch(monkeypatch, [{"n": 1}, {"n": 2, "bad": True}, {"n": 3}])
+    assert [entry["message"] for entry in failed] == [{"n": 2, "bad": True}]
+    assert failed[0]["queue"] == "notification-events"
+    assert failed[0]["error"] == "bad event"
+
+
+
+def test_prefetch_failure_dead_letters_every_event(monkeypatch):
+    def failing_prefetch(events):
+        raise RuntimeError("database unavailable")
+
+    sent = []
+    monkeypatch.setattr(worker, "prefetch_matching_users", failing_prefetch)
+    monkeypatch.setattr(worker, "process_notification_event", sent.append)
+
+    queue = RedisQueue("notification-events")
+    queue.client = _FakeRedis([{"n": 1}, {"n": 2}])
+    with pytest.raises(_Stop):
+        queue.consume_forever_batch(worker.process_notification_batch)
+
+    assert sent == []
+    assert [entry["message"] for entry in queue.client.failed] == [{"n": 1}, {"n": 2}]
+    assert all(entry["error"] == "database unavailable" for entry in queue.client.failed)
+
+
+def test_callback_error_dead_letters_the_rest_of_the_batch():
+    def callback(messages, dead_letter):
+        dead_letter(messages[0], ValueError("bad event"))
+        raise RuntimeError("batch failed")
+
+    queue = RedisQueue("notification-events")
+    queue.client = _FakeRedis([{"n": 1}, {"n": 2}, {"n": 3}])
+    with pytest.raises(_Stop):
+        queue.consume_forever_batch(callback)
+
+    failed = queue.client.failed
+    assert [entry["message"] for entry in failed] == [{"n": 1}, {"n": 2}, {"n": 3}]
+    assert [entry["error"] for entry in failed] == ["bad event", "batch failed", "batch failed"]
@@ -35,3 +35,13 @@ class TestSettings:
         monkeypatch.delenv("DATABASE_URL", raising=False)
         with pytest.raises(Exception):
             Settings()
+
+    def test_db_pool_defaults(self):
+        """Pool settings keep the previous engine defaults, echo is off."""
+        s = Settings()
+        assert s.db_pool_size == 5
+        assert s.db_max_overflow == 10
+        assert s.db_pool_timeout == 30
+        assert s.db_pool_pre_ping is True
+        assert s.db_query_cache_size == 1200
+        assert s.db_echo is False
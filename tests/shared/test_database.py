@@ -0,0 +1,13 @@
+"""Tests for shared.database engine setup."""
+import json
+
+from shared.database import _json_dumps, engine
+
+
+def test_json_dumps_matches_stdlib_output():
+    value = {"b": [1, 2.5, None, True], "a": {"nested": "é"}, 3: "int key"}
+    assert json.loads(_json_dumps(value)) == json.loads(json.dumps(value))
+
+
+def test_engine_uses_orjson_for_json_columns():
+    assert engine.dialect._json_serializer is _json_dumps
@@ -31,3 +31,7 @@ class TestHtmlToText:
         html = "Tom &amp; Jerry &lt;3&gt;"
         result = _html_to_text(html)
         assert "Tom & Jerry <3>" in result
+
+    def test_escaped_entity_decoded_once(self):
+        # Jinja autoescape turns a literal "&lt;" in user text into "&amp;lt;"
+        assert _html_to_text("a &amp;lt; b") == "a &lt; b"
@@ -0,0 +1,61 @@
+"""Tests for the JSON log formatter."""
+import json
+import logging
+import sys
+from datetime import datetime
+from decimal import Decimal
+
+from shared.logger import CustomJsonFormatter, clear_context, set_image_id
+
+
+def _record(msg="hello %s", args=("world",), exc_info=None, **extra):
+    record = logging.LogRecord("ingestion", logging.INFO, __file__, 1, msg, args, exc_info)
+    record.__dict__.update(extra)
+    return record
+
+
+def test_standard_and_static_fields():
+    formatter = CustomJsonFormatter(static_fields={"service": "ingestion"})
+    out = json.loads(formatter.format(_record()))
+    assert out["message"] == "hello world"
+    assert out["level"] == "INFO"
+    assert out["logger"] == "ingestion"
+    assert out["service"] == "ingestion"
+    assert "timestamp" in out
+    assert "args" not in out and "msg" not in out
+
+
+def test_extra_fields_are_kept():
+    out = json.loads(CustomJsonFormatter().format(_record(
+        image_id="abc", count=3, when=datetime(2026, 1, 1, 12, 0), size=Decimal("1.5"),
+    )))
+    assert out["image_id"] == "abc"
+    assert out["count"] == 3
+    assert out["when"] == "2026-01-01T12:00:00Z"
+    assert out["size"] == "1.5"
+
+
+def test_exception_info_is_formatted():
+    try:
+        raise ValueError("boom")
+    except ValueError:
+        record = _record(exc_info=sys.exc_info())
+    out = json.loads(CustomJsonFormatter().format(record))
+    assert "ValueError: boom" in out["exc_info"]
+
+
+def test_correlation_ids_read_from_context():
+    set_image_id("img-1")
+    try:
+        out = json.loads(CustomJsonFormatter().format(_record()))
+    finally:
+        clear_context()
+    assert out["image_id"] == "img-1"
+    assert "request_id" not in out
+
+
+def test_static_fields_are_not_repeated():
+    formatter = CustomJsonFormatter(static_fields={"service": "api"})
+    line = formatter.format(_record(service="other"))
+    assert line.startswith('{"service":"api",')
+    assert line.count('"service"') == 1
@@ -0,0 +1,20 @@
+"""Tests that shared.models declares the indexes the migrations create."""
+from shared.models import Base
+
+
+def _index_names(table_name):
+    return {index.name for index in Base.metadata.tables[table_name].indexes}
+
+
+def test_fk_columns_are_covered_by_composite_indexes():
+    assert 'ix_images_camera_id_captured_at_cover' in _index_names('images')
+    assert 'ix_detections_image_id_confidence_cover' in _index_names('detections')
+    assert 'ix_classifications_detection_species_conf' in _index_names('classifications')
+
+
+def test_notification_logs_created_at_uses_brin():
+    index = next(
+        index for index in Base.metadata.tables['notification_logs'].indexes
+        if index.name == 'ix_notification_logs_created_at_brin'
+    )
+    assert index.dialect_options['postgresql']['using'] == 'brin'
@@ -21,3 +21,78 @@ def test_queue_names_are_unique():
     ]
     assert len(names) == len(set(names))
     assert all(isinstance(n, str) and n for n in names)
+
+
+class _FakeRedis:
+    """Minimal list-backed stand-in for the redis list calls RedisQueue makes."""
+
+    def __init__(self, items):
+        self.items = list(items)
+
+    def lpush(self, name, *values):
+        for value in values:
+            self.items.insert(0, value)
+
+    def ltrim(self, name, start, end):
+        self.items = self.items[start:end + 1]
+
+    def brpop(self, name, timeout=0):
+        return (name, self.items.pop()) if self.items else None
+
+    def blmpop(self, timeout, numkeys, name, direction, count=1):
+        assert direction == "RIGHT"
+        popped = []
+        while self.items and len(popped) < count:
+            popped.append(self.items.pop())
+        return [name, popped] if popped else None
+
+
+def _queue_with(items):
+    from shared.queue import RedisQueue
+
+    queue = RedisQueue("test-queue")
+    queue.client = _FakeRedis(items)
+    return queue
+
+
+def test_consume_batch_takes_waiting_messages_in_order():
+    # LPUSH puts the newest message at the head, so the oldest is last
+    queue = _queue_with(['{"n": 3}', '{"n": 2}', '{"n": 1}'])
+    assert queue.consume_batch(2) == [{"n": 1}, {"n": 2}]
+    assert queue.consume_batch(2) == [{"n": 3}]
+
+
+def test_consume_batch_empty_on_timeout():
+    assert _queue_with([]).consume_batch(10, timeout=1) == []
+
+
+def test_publish_many_keeps_order_for_consumers():
+    queue = _queue_with([])
+    queue.publish_many([{"n": 1}, {"n": 2}])
+    queue.publish({"n": 3})
+    assert queue.consume_batch(10) == [{"n": 1}, {"n": 2}, {"n": 3}]
+
+
+def test_queues_share_one_client():
+    from shared.queue import RedisQueue
+
+    assert RedisQueue("a").client is RedisQueue("b").client
+
+
+def test_publish_encodes_json_readable_by_stdlib():
+    import json
+
+    queue = _queue_with([])
+    queue.publish({"species": "chevreuil é", 1: "x"})
+    assert json.loads(queue.client.items[0]) == {"species": "chevreuil é", "1": "x"}
+
+
+def test_dead_letter_keeps_source_queue_and_error():
+    import json
+
+    queue = _queue_with([])
+    queue._dead_letter({"n": 1}, "image-ingested", ValueError("boom"))
+    entry = json.loads(queue.client.items[0])
+    assert entry["queue"] == "image-ingested"
+    assert entry["error"] == "boom"
+    assert entry["message"] == {"n": 1}
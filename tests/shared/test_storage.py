@@ -0,0 +1,47 @@
+"""Tests for shared.storage."""
+from shared.storage import StorageClient
+
+
+def test_storage_clients_share_one_boto3_client():
+    assert StorageClient().client is StorageClient().client
+
+
+class _FakeS3:
+    """Stand-in for the boto3 calls list_objects and delete_objects make."""
+
+    def __init__(self, keys):
+        self.keys = list(keys)
+        self.delete_calls = []
+
+    def get_paginator(self, name):
+        keys = self.keys
+
+        class _Paginator:
+            def paginate(self, **kwargs):
+                for start in range(0, len(keys), 1000):
+                    yield {"Contents": [{"Key": k} for k in keys[start:start + 1000]]}
+
+        return _Paginator()
+
+    def delete_objects(self, Bucket, Delete):
+        self.delete_calls.append([obj["Key"] for obj in Delete["Objects"]])
+        return {}
+
+
+def _storage_with(keys):
+    storage = StorageClient()
+    storage.client = _FakeS3(keys)
+    return storage
+
+
+def test_list_objects_reads_every_page():
+    keys = [f"cam/{i:05d}.jpg" for i in range(2500)]
+    assert _storage_with(keys).list_objects("raw-images", prefix="cam/") == keys
+
+
+def test_delete_objects_batches_by_1000():
+    keys = [f"cam/{i:05d}.jpg" for i in range(2500)]
+    storage = _storage_with([])
+    assert storage.delete_objects("raw-images", keys) == 2500
+    assert [len(batch) for batch in storage.client.delete_calls] == [1000, 1000, 500]
+    assert storage.delete_objects("raw-images", []) == 0